@@ -4,6 +4,22 @@ import datetime
 import os
 import sys
 
+# Jack pair name -> (horizontal jack, vertical jack)
+INPUT_JACK_PAIRS = {"j3_j4": ("J3", "J4"), "j5_j6": ("J5", "J6"), "j7_j8": ("J7", "J8")}
+OUTPUT_JACK_PAIRS = {"j9_j10": ("J9", "J10"), "j11_j12": ("J11", "J12"), "j13_j14": ("J13", "J14")}
+
+# Calibration frequency (Hz) -> jack pair measured at that frequency
+INPUT_JACK_BY_FREQUENCY = {3e+9: "j3_j4", 1.25e+10: "j5_j6", 2.8e+10: "j7_j8"}
+OUTPUT_JACK_BY_FREQUENCY = {3e+9: "j9_j10", 1.25e+10: "j11_j12", 2.8e+10: "j13_j14"}
+
+# Column order of the calibration CSV: (loss dict attribute, jack)
+CAL_COLUMNS = (
+    ("input_horizontal_loss", "J3"), ("input_horizontal_loss", "J5"), ("input_horizontal_loss", "J7"),
+    ("output_horizontal_loss", "J9"), ("output_horizontal_loss", "J11"), ("output_horizontal_loss", "J13"),
+    ("input_vertical_loss", "J4"), ("input_vertical_loss", "J6"), ("input_vertical_loss", "J8"),
+    ("output_vertical_loss", "J10"), ("output_vertical_loss", "J12"), ("output_vertical_loss", "J14"),
+)
+
 class Calibration:
     def __init__(self):
         self.input_horizontal_loss = {"J3": 0, "J5": 0, "J7": 0}
@@ -24,58 +40,41 @@ class Calibration:
         self.input_vertical_loss = input_vertical
         self.output_vertical_loss = output_vertical
 
-    def write2file(self, data):
+    def write2file(self, *rows):
         with open(self.cal_data_filepath, mode='w', newline='') as file:
             writer = csv.writer(file)
-            writer.writerow(data)
-            file.close()
+            writer.writerows(rows)
 
     def save_calibration(self):
-        self.write2file(["J3", "J5", "J7", "J9", "J11", "J13", "J4", "J6", "J8", "J10", "J12", "J14"])
-        self.write2file([self.input_horizontal_loss["J3"], self.input_horizontal_loss["J5"], self.input_horizontal_loss["J7"],
-                         self.output_horizontal_loss["J9"], self.output_horizontal_loss["J11"], self.output_horizontal_loss["J13"],
-                         self.input_vertical_loss["J4"], self.input_vertical_loss["J6"], self.input_vertical_loss["J8"],
-                         self.output_vertical_loss["J10"], self.output_vertical_loss["J12"], self.output_vertical_loss["J14"]])
+        # Header and values in one write; separate 'w' opens would overwrite the header
+        header = [jack for _, jack in CAL_COLUMNS]
+        values = [getattr(self, attr)[jack] for attr, jack in CAL_COLUMNS]
+        self.write2file(header, values)
 
     def get_input_loss(self, jack):
-        jack = jack.lower()
-        if jack == 'j3_j4':
-            return self.input_horizontal_loss["J3"], self.input_vertical_loss["J4"]
-        elif jack == 'j5_j6':
-            return self.input_horizontal_loss["J5"], self.input_vertical_loss["J6"]
-        elif jack == 'j7_j8':
-            return self.input_horizontal_loss["J7"], self.input_vertical_loss["J8"]
-        else:
-            raise ValueError()
+        try:
+            horizontal, vertical = INPUT_JACK_PAIRS[jack.lower()]
+        except KeyError:
+            raise ValueError(jack)
+        return self.input_horizontal_loss[horizontal], self.input_vertical_loss[vertical]
         
     def get_output_loss(self, jack):
-        print(jack)
-        jack = jack.lower()
-        if jack == 'j9_j10':
-            return self.output_horizontal_loss["J9"], self.output_vertical_loss["J10"]
-        elif jack == 'j11_j12':
-            return self.output_horizontal_loss["J11"], self.output_vertical_loss["J12"]
-        elif jack == 'j13_j14':
-            return self.output_horizontal_loss["J13"], self.output_vertical_loss["J14"]
-        else:
-            raise ValueError()
+        try:
+            horizontal, vertical = OUTPUT_JACK_PAIRS[jack.lower()]
+        except KeyError:
+            raise ValueError(jack)
+        return self.output_horizontal_loss[horizontal], self.output_vertical_loss[vertical]
         
     def get_output_loss_at_frequency(self, frequency):
-        if frequency == 3e+9:
-            return self.output_horizontal_loss["J9"], self.output_vertical_loss["J10"]
-        elif frequency == 1.25e+10:
-            return self.output_horizontal_loss["J11"], self.output_vertical_loss["J12"]
-        elif frequency == 2.8e+10:
-            return self.output_horizontal_loss["J13"], self.output_vertical_loss["J14"]
-        else:
-            raise ValueError()
+        try:
+            jack = OUTPUT_JACK_BY_FREQUENCY[frequency]
+        except KeyError:
+            raise ValueError(frequency)
+        return self.get_output_loss(jack)
 
     def get_input_loss_at_frequency(self, frequency):
-        if frequency == 3e+9:
-            return self.input_horizontal_loss["J3"], self.input_vertical_loss["J4"]
-        elif frequency == 1.25e+10:
-            return self.input_horizontal_loss["J5"], self.input_vertical_loss["J6"]
-        elif frequency == 2.8e+10:
-            return self.input_horizontal_loss["J7"], self.input_vertical_loss["J8"]
-        else:
-            raise ValueError()
\ No newline at end of file
+        try:
+            jack = INPUT_JACK_BY_FREQUENCY[frequency]
+        except KeyError:
+            raise ValueError(frequency)
+        return self.get_input_loss(jack)
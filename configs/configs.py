@@ -2,25 +2,60 @@ import time
 
 from configs.calibration import Calibration
 import os
-import datetime
+
+# Per-path PA configuration:
+# (path, file prefix, S21 switchpath, S11 switchpath, S22 switchpath, SA switchpath,
+#  SA freqs, harmonic start/stop, wideband start/stop)
+PA_PATH_DEFS = (
+    ("Band1_SN1", "band1_1", (1,1,1,1,1,1), (1,1,1,1,1,1), (1,1,1,1,4,4), (2,1,1,2,1,1),
+     (1.95E+9, 3E+9, 4E+9), (1e+9, 17e+9), (1e+9, 8e+9)),
+    ("Band2_SN1", "band2_1", (1,2,2,1,1,1), (1,2,2,1,4,4), (1,2,2,1,4,4), (2,2,2,2,1,1),
+     (10E+9, 12.5E+9, 15E+9), (9e+9, 40e+9), (5e+9, 20e+9)),
+    ("Band3_SN1", "band3_1", (1,3,3,1,1,1), (1,3,3,1,4,4), (1,3,3,1,4,4), (2,3,3,2,1,1),
+     (25E+9, 28E+9, 31E+9), (18e+9, 40e+9), (18e+9, 40e+9)),
+    ("Band1_SN2", "band1_2", (1,4,4,1,1,1), (1,4,4,1,4,4), (1,4,4,1,4,4), (2,4,4,2,1,1),
+     (1.95E+9, 3E+9, 4E+9), (1e+9, 17e+9), (1e+9, 8e+9)),
+    ("Band2_SN2", "band2_2", (1,5,5,1,1,1), (1,5,5,1,4,4), (1,5,5,1,4,4), (2,5,5,2,1,1),
+     (10E+9, 12.5E+9, 15E+9), (9e+9, 40e+9), (5e+9, 20e+9)),
+    ("Band3_SN2", "band3_2", (1,6,6,1,1,1), (1,6,6,1,4,4), (1,6,6,1,4,4), (2,6,6,2,1,1),
+     (25E+9, 28E+9, 31E+9), (18e+9, 20e+9), (18e+9, 40e+9)),
+)
+
+# Path name prefix ("Band1_SN1"[:5]) -> band letter
+BAND_PREFIX_TO_LETTER = {"Band1": "L", "Band2": "M", "Band3": "H"}
+
+def _slots_to_dict(obj):
+    """Collect the assigned __slots__ attributes of obj (across its class hierarchy) into a dict."""
+    data = {}
+    for cls in reversed(type(obj).__mro__):
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(obj, slot):
+                data[slot] = getattr(obj, slot)
+    return data
 
 class Config:
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
     
     def to_dict(self):
-        print("Converting to dict")
-        return self.__dict__
+        return _slots_to_dict(self)
     
 class LynxOQPSKConfig(Config):
+    __slots__ = ("frequencies", "_freq_to_band", "gain_settings", "static_bandwidths",
+                 "harmonic_measurement_bandwidths", "waveforms", "sa_save_register",
+                 "paths", "input_losses", "output_losses")
+
     def __init__(self):
         super().__init__("OQPSK_CALIBRATION")
-        print("Initializing OQPSK")
         self.frequencies = {
             "L": [1.95E+9, 3E+9, 4E+9],
             "M": [10E+9, 12.5E+9, 15E+9],
             "H": [25E+9, 28E+9, 31E+9]
         }
+        # Frequency -> band letter, built once for get_bandpath_by_frequency
+        self._freq_to_band = {f: band for band, freqs in self.frequencies.items() for f in freqs}
 
         self.gain_settings = [41]
         self.static_bandwidths = [10E+6, 200E+6]
@@ -62,30 +97,18 @@ class LynxOQPSKConfig(Config):
         }
 
     def get_input_loss_by_switchpath_and_freq(self, switchpath, freq):
-        input_loss = 0
-        for path, losses in self.input_losses.items():
-            if switchpath == path:
-                print(losses)
-                input_loss = losses[freq]
-                break
-
-        return input_loss
+        return self.input_losses.get(switchpath, {}).get(freq, 0)
     
     def get_output_loss_by_switchpath_and_freq(self, switchpath, freq):
-        output_loss = 0
-        for path, losses in self.output_losses.items():
-            if switchpath == path:
-                output_loss = losses[freq]
-                break
-
-        return output_loss
+        return self.output_losses.get(switchpath, {}).get(freq, 0)
     
     def get_bandpath_by_frequency(self,frequency):
-        for bandpath, freqs in self.frequencies.items():
-            if frequency in freqs:
-                return bandpath
+        return self._freq_to_band.get(frequency)
 
 class LynxPaConfig(Config):
+    __slots__ = ("base_dir", "test_dir", "data_dir_base", "data_dir_results", "paths", "_result_files",
+                 "_path_to_band", "output_losses", "input_losses")
+
     def __init__(self, project):
         super().__init__("LYNX_PA")
 
@@ -117,267 +140,110 @@ class LynxPaConfig(Config):
 
 
     def create_session_dir(self):
-        start_timestamp = datetime.datetime.now()
-        session = start_timestamp.strftime("%Y%m%d%H%M%S")
+        session = time.strftime("%Y%m%d%H%M%S")
         self.data_dir_results = os.path.join(self.data_dir_results, session)
-
-        if not os.path.exists(self.data_dir_results):
-            os.mkdir(self.data_dir_results)
+        os.makedirs(self.data_dir_results, exist_ok=True)
 
     def change_sno_dir(self, sno):
         self.data_dir_results = os.path.join(self.data_dir_results, sno)
-        if not os.path.exists(self.data_dir_results):
-            os.mkdir(self.data_dir_results)
+        os.makedirs(self.data_dir_results, exist_ok=True)
 
     def change_results_dir(self, results_dir_name):
         self.data_dir_results = os.path.join(self.data_dir_results, results_dir_name)
-        if not os.path.exists(self.data_dir_results):
-            os.mkdir(self.data_dir_results)
+        os.makedirs(self.data_dir_results, exist_ok=True)
 
     def new_sno(self, sno, results_dir_name):
         self.data_dir_results = self.data_dir_base
         self.change_sno_dir(sno)
         self.change_results_dir(results_dir_name)
         self.create_session_dir()
-        self.init_paths()
+        self._update_result_paths()
 
     def init_paths(self):
-        self.paths = {
-            "Band1_SN1": {
-                "S21":{
-                    "switchpath": [1,1,1,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band1_1_gain_phase.csa"),
-                    "gain_results_filepath": os.path.join(self.data_dir_results, "band1_1_gain.csv"),
-                    "phase_results_filepath": os.path.join(self.data_dir_results, "band1_1_phase.csv")
-                },
-                "S11":{
-                    "switchpath": [1,1,1,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band1_1_S11.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band1_1_S11.csv")
-                },
-                "S22":{
-                    "switchpath": [1,1,1,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band1_1_S22.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band1_1_S22.csv")
-
-                },
-                "Signal Analyzer Bandwidth": {
-                    "switchpath": [2,1,1,2,1,1],
-                    "register": "1",
-                    "standard_results_filepath": os.path.join(self.data_dir_results, "band1_1_bandwidth.csv"),
-                    "harmonic_results_filepath":  os.path.join(self.data_dir_results, "band1_1_harmonic_bandwidth.csv"),
-                    "power_meter_filepath": os.path.join(self.data_dir_results, "band1_1_power_meter.csv"),
-                    "wideband_results_filepath": os.path.join(self.data_dir_results, "band1_1_wideband.csv"),
-                    "freqs": [1.95E+9, 3E+9, 4E+9],
-                    "attenuation_settings": [0,31],
-                    "bandwidths": [10E+6, 200E+6],
-                    "harmonic_start_stop": [1e+9, 17e+9],
-                    "wideband_start_stop": [1e+9, 8e+9],
-                    "waveforms": ["CW", "OQPSK"]
-                }
-            },
-            "Band2_SN1": {
-                "S21":{
-                    "switchpath": [1,2,2,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band2_1_gain_phase.csa"),
-                    "gain_results_filepath": os.path.join(self.data_dir_results, "band2_1_gain.csv"),
-                    "phase_results_filepath": os.path.join(self.data_dir_results, "band2_1_phase.csv")
-                },
-                "S11":{
-                    "switchpath": [1,2,2,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band2_1_S11.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band2_1_S11.csv")
-                },
-                "S22":{
-                    "switchpath": [1,2,2,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band2_1_S22.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band2_1_S22.csv")
-                },
-                "Signal Analyzer Bandwidth": {
-                    "switchpath": [2,2,2,2,1,1],
-                    "register": "1",
-                    "standard_results_filepath": os.path.join(self.data_dir_results, "band2_1_bandwidth.csv"),
-                    "harmonic_results_filepath":  os.path.join(self.data_dir_results, "band2_1_harmonic_bandwidth.csv"),
-                    "power_meter_filepath": os.path.join(self.data_dir_results, "band2_1_power_meter.csv"),
-                    "wideband_results_filepath": os.path.join(self.data_dir_results, "band2_1_wideband.csv"),
-                    "freqs": [10E+9, 12.5E+9, 15E+9],
-                    "attenuation_settings": [0,31],
-                    "bandwidths": [10E+6, 200E+6],
-                    "harmonic_start_stop": [9e+9, 40e+9],
-                    "wideband_start_stop": [5e+9, 20e+9],
-                    "waveforms": ["CW", "OQPSK"]
-                }
-            },
-            "Band3_SN1": {
-                "S21":{
-                    "switchpath": [1,3,3,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band3_1_gain_phase.csa"),
-                    "gain_results_filepath": os.path.join(self.data_dir_results, "band3_1_gain.csv"),
-                    "phase_results_filepath": os.path.join(self.data_dir_results, "band3_1_phase.csv")
-                },
-                "S11":{
-                    "switchpath": [1,3,3,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band3_1_S11.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band3_1_S11.csv")
-                },
-                "S22":{
-                    "switchpath": [1,3,3,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band3_1_S22.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band3_1_S22.csv")
-                },
-                "Signal Analyzer Bandwidth": {
-                    "switchpath": [2,3,3,2,1,1],
-                    "register": "1",
-                    "standard_results_filepath": os.path.join(self.data_dir_results, "band3_1_bandwidth.csv"),
-                    "harmonic_results_filepath":  os.path.join(self.data_dir_results, "band3_1_harmonic_bandwidth.csv"),
-                    "power_meter_filepath": os.path.join(self.data_dir_results, "band3_1_power_meter.csv"),
-                    "wideband_results_filepath": os.path.join(self.data_dir_results, "band3_1_wideband.csv"),
-                    "freqs": [25E+9, 28E+9, 31E+9],
-                    "attenuation_settings": [0,31],
-                    "bandwidths": [10E+6, 200E+6],
-                    "harmonic_start_stop": [18e+9, 40e+9],
-                    "wideband_start_stop": [18e+9, 40e+9],
-                    "waveforms": ["CW", "OQPSK"]
-                }
-            },
-            "Band1_SN2": {
-                "S21":{
-                    "switchpath": [1,4,4,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band1_2_gain_phase.csa"),
-                    "gain_results_filepath": os.path.join(self.data_dir_results, "band1_2_gain.csv"),
-                    "phase_results_filepath": os.path.join(self.data_dir_results, "band1_2_phase.csv")
-                },
-                "S11":{
-                    "switchpath": [1,4,4,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band1_2_S11.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band1_2_S11.csv")
-                },
-                "S22":{
-                    "switchpath": [1,4,4,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band1_2_S22.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band1_2_S22.csv")
-                },
-                "Signal Analyzer Bandwidth": {
-                    "switchpath": [2,4,4,2,1,1],
-                    "register": "1",
-                    "standard_results_filepath": os.path.join(self.data_dir_results, "band1_2_bandwidth.csv"),
-                    "harmonic_results_filepath":  os.path.join(self.data_dir_results, "band1_2_harmonic_bandwidth.csv"),
-                    "power_meter_filepath": os.path.join(self.data_dir_results, "band1_2_power_meter.csv"),
-                    "wideband_results_filepath": os.path.join(self.data_dir_results, "band1_2_wideband.csv"),
-                    "freqs": [1.95E+9, 3E+9, 4E+9],
-                    "attenuation_settings": [0,31],
-                    "bandwidths": [10E+6, 200E+6],
-                    "harmonic_start_stop": [1e+9, 17e+9],
-                    "wideband_start_stop": [1e+9, 8e+9],
-                    "waveforms": ["CW", "OQPSK"]
-                }
-            },
-            "Band2_SN2": {
-                "S21":{
-                    "switchpath": [1,5,5,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band2_2_gain_phase.csa"),
-                    "gain_results_filepath": os.path.join(self.data_dir_results, "band2_2_gain.csv"),
-                    "phase_results_filepath": os.path.join(self.data_dir_results, "band2_2_phase.csv")
-                },
-                "S11":{
-                    "switchpath": [1,5,5,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band2_2_S11.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band2_2_S11.csv")
-                },
-                "S22":{
-                    "switchpath": [1,5,5,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band2_2_S22.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band2_2_S22.csv")
-                },
-                "Signal Analyzer Bandwidth": {
-                    "switchpath": [2,5,5,2,1,1],
-                    "register": "1",
-                    "standard_results_filepath": os.path.join(self.data_dir_results, "band2_2_bandwidth.csv"),
-                    "harmonic_results_filepath":  os.path.join(self.data_dir_results, "band2_2_harmonic_bandwidth.csv"),
-                    "power_meter_filepath": os.path.join(self.data_dir_results, "band2_2_power_meter.csv"),
-                    "wideband_results_filepath": os.path.join(self.data_dir_results, "band2_2_wideband.csv"),
-                    "freqs": [10E+9, 12.5E+9, 15E+9],
-                    "attenuation_settings": [0,31],
-                    "bandwidths": [10E+6, 200E+6],
-                    "harmonic_start_stop": [9e+9, 40e+9],
-                    "wideband_start_stop": [5e+9, 20e+9],
-                    "waveforms": ["CW", "OQPSK"]
-                }
-            },
-            "Band3_SN2": {
-                "S21":{
-                    "switchpath": [1,6,6,1,1,1],
-                    "state_filepath": os.path.join(self.base_dir, "band3_2_gain_phase.csa"),
-                    "gain_results_filepath": os.path.join(self.data_dir_results, "band3_2_gain.csv"),
-                    "phase_results_filepath": os.path.join(self.data_dir_results, "band3_2_phase.csv")
-                },
-                "S11":{
-                    "switchpath": [1,6,6,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band3_2_S11.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band3_2_S11.csv")
-                },
-                "S22":{
-                    "switchpath": [1,6,6,1,4,4],
-                    "state_filepath": os.path.join(self.base_dir, "band3_2_S22.csa"),
-                    "results_filepath": os.path.join(self.data_dir_results, "band3_2_S22.csv")
-                },
-                "Signal Analyzer Bandwidth": {
-                    "switchpath": [2,6,6,2,1,1],
-                    "register": "1",
-                    "standard_results_filepath": os.path.join(self.data_dir_results, "band3_2_bandwidth.csv"),
-                    "harmonic_results_filepath":  os.path.join(self.data_dir_results, "band3_2_harmonic_bandwidth.csv"),
-                    "power_meter_filepath": os.path.join(self.data_dir_results, "band3_2_power_meter.csv"),
-                    "wideband_results_filepath": os.path.join(self.data_dir_results, "band3_2_wideband.csv"),
-                    "freqs": [25E+9, 28E+9, 31E+9],
-                    "attenuation_settings": [0,31],
-                    "bandwidths": [10E+6, 200E+6],
-                    "harmonic_start_stop": [18e+9, 20e+9],
-                    "wideband_start_stop": [18e+9, 40e+9],
-                    "waveforms": ["CW", "OQPSK"]
-                }
+        """Build the per-path measurement config; result filepaths point into data_dir_results."""
+        base_dir = self.base_dir
+        self.paths = {}
+        # Path name -> band letter, resolved once here instead of per get_bandpath_by_path call
+        self._path_to_band = {}
+        # (measurement dict, key, result filename) for every filepath under data_dir_results
+        self._result_files = []
+        for (path, prefix, s21_switchpath, s11_switchpath, s22_switchpath, sa_switchpath,
+             freqs, harmonic_start_stop, wideband_start_stop) in PA_PATH_DEFS:
+            s21 = {
+                "switchpath": list(s21_switchpath),
+                "state_filepath": os.path.join(base_dir, f"{prefix}_gain_phase.csa"),
             }
-        }
+            s11 = {
+                "switchpath": list(s11_switchpath),
+                "state_filepath": os.path.join(base_dir, f"{prefix}_S11.csa"),
+            }
+            s22 = {
+                "switchpath": list(s22_switchpath),
+                "state_filepath": os.path.join(base_dir, f"{prefix}_S22.csa"),
+            }
+            sa = {
+                "switchpath": list(sa_switchpath),
+                "register": "1",
+                "freqs": list(freqs),
+                "attenuation_settings": [0,31],
+                "bandwidths": [10E+6, 200E+6],
+                "harmonic_start_stop": list(harmonic_start_stop),
+                "wideband_start_stop": list(wideband_start_stop),
+                "waveforms": ["CW", "OQPSK"]
+            }
+            self._result_files += [
+                (s21, "gain_results_filepath", f"{prefix}_gain.csv"),
+                (s21, "phase_results_filepath", f"{prefix}_phase.csv"),
+                (s11, "results_filepath", f"{prefix}_S11.csv"),
+                (s22, "results_filepath", f"{prefix}_S22.csv"),
+                (sa, "standard_results_filepath", f"{prefix}_bandwidth.csv"),
+                (sa, "harmonic_results_filepath", f"{prefix}_harmonic_bandwidth.csv"),
+                (sa, "power_meter_filepath", f"{prefix}_power_meter.csv"),
+                (sa, "wideband_results_filepath", f"{prefix}_wideband.csv"),
+            ]
+            self.paths[path] = {"S21": s21, "S11": s11, "S22": s22, "Signal Analyzer Bandwidth": sa}
+            self._path_to_band[path] = BAND_PREFIX_TO_LETTER.get(path[:5])
+
+        self._update_result_paths()
+
+    def _update_result_paths(self):
+        """Re-point only the result filepaths at the current data_dir_results."""
+        results_dir = self.data_dir_results
+        for measurement, key, filename in self._result_files:
+            measurement[key] = os.path.join(results_dir, filename)
 
     def get_output_loss_by_path_and_freq(self, path, freq):
-        output_loss = 0
-        for bandpath, losses in self.output_losses.items():
-            if path == bandpath:
-                output_loss = losses[freq]
-                break
-
-        return output_loss
+        return self.output_losses.get(path, {}).get(freq, 0)
 
     def get_input_loss_by_path_and_freq(self, path, freq):
-        input_loss = 0
-        for bandpath, losses in self.input_losses.items():
-            if path == bandpath:
-                input_loss = losses[freq]
-                break
-
-        return input_loss
+        return self.input_losses.get(path, {}).get(freq, 0)
 
     def get_bandpath_by_path(self, path):
-        if "Band1" in path:
-            return "L"
-        elif "Band2" in path:
-            return "M"
-        elif "Band3" in path:
-            return "H"
+        try:
+            return self._path_to_band[path]
+        except KeyError:
+            return BAND_PREFIX_TO_LETTER.get(path[:5])
 
 class Results:
+    __slots__ = ("name", "frequencies")
+
     def __init__(self, name):
         self.name = None
         self.frequencies = []
 
     def to_dict(self):
-        return self.__dict__
+        return _slots_to_dict(self)
     
 class PNAXResults(Results):
+    __slots__ = ("paths",)
+
     def __init__(self):
         super().__init__("PNAX_Result")
         self.paths = {}
 
 class OQPSKResults(Results):
+    __slots__ = ("paths",)
+
     def __init__(self):
         super().__init__("OQPSK_Result")
         self.paths = {}
\ No newline at end of file
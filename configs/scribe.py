@@ -1,6 +1,6 @@
 import csv
 import os
-import datetime
+import time
 import numpy
 import pathlib
 # import xlsxwriter
@@ -15,23 +15,21 @@ class Scribe:
         self.base_dir = os.path.join(self.test_dir, f"{project}_data")
 
         self.headers = []
+        # filepath -> (open file, csv writer) kept open across write_* calls; see close_files
+        self._files = {}
 
     def create_session_dir(self):
-        start_timestamp = datetime.datetime.now()
-        session = start_timestamp.strftime("%Y%m%d%H%M%S")
+        session = time.strftime("%Y%m%d%H%M%S")
         self.data_dir = os.path.join(self.data_dir, session)
-        if not os.path.exists(self.data_dir):
-            os.mkdir(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
     def change_sno_dir(self, sno):
         self.data_dir = os.path.join(self.data_dir, sno)
-        if not os.path.exists(self.data_dir):
-            os.mkdir(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
     def change_results_dir(self, results_dir_name):
         self.data_dir = os.path.join(self.data_dir, results_dir_name)
-        if not os.path.exists(self.data_dir):
-            os.mkdir(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
     def new_sno(self, sno, results_dir_name):
         self.data_dir = self.base_dir
@@ -77,39 +75,44 @@ class Scribe:
         }
 
     
-    def write_data_from_filepath(self, filepath, data):
-        print(filepath)
-        with open(filepath, 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data)
+    def _get_writer(self, filepath):
+        """Return a csv writer on filepath opened for append, reusing the open file across calls"""
+        entry = self._files.get(filepath)
+        if entry is None:
+            f = open(filepath, 'a', encoding="utf-8", newline="")
+            entry = self._files[filepath] = (f, csv.writer(f))
+        return entry
+
+    def close_files(self):
+        """Close every file held open by the write_* methods"""
+        files, self._files = self._files, {}
+        for f, _ in files.values():
             f.close()
 
+    def write_data_from_filepath(self, filepath, data):
+        f, writer = self._get_writer(filepath)
+        writer.writerow(data)
+        f.flush()
+
+    def write_rows_from_filepath(self, filepath, rows):
+        f, writer = self._get_writer(filepath)
+        writer.writerows(rows)
+        f.flush()
+
     def write_bandwidth_data_from_array(self, switchpath, data_array):
-        with open(self.bandwidth_fnames[switchpath], 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data_array)
-            f.close()
+        self.write_data_from_filepath(self.bandwidth_fnames[switchpath], data_array)
 
     def write_bandwidth_module_data_from_array(self, switchpath, data_array):
-        with open(self.bandwidth_module_fnames[switchpath], 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data_array)
-            f.close()
+        self.write_data_from_filepath(self.bandwidth_module_fnames[switchpath], data_array)
 
 
     def write_power_meter_module_data_from_array(self, switchpath, data_array):
-        with open(self.power_meter_module_fnames[switchpath], 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data_array)
-            f.close()
+        self.write_data_from_filepath(self.power_meter_module_fnames[switchpath], data_array)
 
     def write_power_meter_data_from_array(self, switchpath, data_array):
-        with open(self.power_meter_fnames[switchpath], 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data_array)
-            f.close()
+        self.write_data_from_filepath(self.power_meter_fnames[switchpath], data_array)
 
-    def write_na_module_data(self, switchpath, ratioed_power, format, data):
+    def _na_module_fname(self, switchpath, ratioed_power, format):
         bat = {}
         if ratioed_power == "S22":
             bat = self.na_22_module_fnames
@@ -121,27 +124,21 @@ class Scribe:
         bat = bat[switchpath]
 
         if format == "MLOG":
-            fname = bat[0]
+            return bat[0]
         elif format == "PHASE":
-            fname = bat[1]
+            return bat[1]
 
-        with open(fname, 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data)
-            f.close()
-        
+    def write_na_module_data(self, switchpath, ratioed_power, format, data):
+        self.write_data_from_filepath(self._na_module_fname(switchpath, ratioed_power, format), data)
+
+    def write_na_module_rows(self, switchpath, ratioed_power, format, rows):
+        self.write_rows_from_filepath(self._na_module_fname(switchpath, ratioed_power, format), rows)
 
     def write_na_gain_data_from_array(self, switchpath, data_array):
-        with open(self.na_gain_fnames[switchpath], 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data_array)
-            f.close()
+        self.write_data_from_filepath(self.na_gain_fnames[switchpath], data_array)
 
     def write_na_phase_data_from_array(self, switchpath, data_array):
-        with open(self.na_phase_fnames[switchpath], 'a', encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(data_array)
-            f.close()
+        self.write_data_from_filepath(self.na_phase_fnames[switchpath], data_array)
 
     def write_data_from_array_to_new_column(self, ):
         print("SHO")
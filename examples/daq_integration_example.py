@@ -12,6 +12,20 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from instruments.hardware_config import get_daq_instance, print_hardware_status, set_simulation_mode
 
+def paced(items, interval):
+    """
+    Yield items no faster than one per interval seconds.
+    
+    Time spent handling an item counts toward its interval, and there is no
+    wait after the last item.
+    """
+    deadline = time.monotonic()
+    for index, item in enumerate(items):
+        if index:
+            deadline += interval
+            time.sleep(max(0.0, deadline - time.monotonic()))
+        yield item
+
 class LynxDAQIntegrationExample:
     """
     Example class showing how to integrate the simulated DAQ
@@ -87,11 +101,12 @@ class LynxDAQIntegrationExample:
         print("   Time     | RF | Band | Gain | Temp  | Faults")
         print("   ---------|----| -----|------|-------|--------")
         
-        for i in range(10):
+        rows = []
+        for _ in paced(range(10), 0.5):
             rf_status, fault_status, band, gain, timestamp, temp = self.daq.read_status_return()
             time_str = timestamp.strftime("%H:%M:%S")
-            print(f"   {time_str} | {rf_status:>2} | {band:>4} | {gain:>2}dB | {temp:>5.1f}°C | {fault_status}")
-            time.sleep(0.5)
+            rows.append(f"   {time_str} | {rf_status:>2} | {band:>4} | {gain:>2}dB | {temp:>5.1f}°C | {fault_status}")
+        sys.stdout.write("\n".join(rows) + "\n")
         
         print("\n=== Test Sequence Complete ===")
     
@@ -134,15 +149,16 @@ class LynxDAQIntegrationExample:
             print("Target Temp | Measured Temp | RF | Band | Gain")
             print("------------|---------------|----| -----|-----")
             
-            for target_temp in temp_points:
+            rows = []
+            for target_temp in paced(temp_points, 0.5):
                 # Set the target temperature for simulation
                 self.daq.set_base_temperature(target_temp)
                 
                 # Read actual temperature (will have some variation)
                 rf_status, fault_status, band, gain, timestamp, measured_temp = self.daq.read_status_return()
                 
-                print(f"{target_temp:>10.1f}°C | {measured_temp:>12.1f}°C | {rf_status:>2} | {band:>4} | {gain:>2}dB")
-                time.sleep(0.5)
+                rows.append(f"{target_temp:>10.1f}°C | {measured_temp:>12.1f}°C | {rf_status:>2} | {band:>4} | {gain:>2}dB")
+            sys.stdout.write("\n".join(rows) + "\n")
             
             print("\nThermal cycle simulation complete.")
         else:
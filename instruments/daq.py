@@ -1,8 +1,14 @@
 import time
 import datetime
 import ast
+from .daq_gain_codes import BASE_NUMS, DBS, DB_TO_HEX, HEX_TO_DB
 
 class RS422_DAQ:
+    BASE_NUMS = BASE_NUMS
+    DBS = DBS
+    _db_to_hex = DB_TO_HEX
+    _hex_to_db = HEX_TO_DB
+
     def __init__(self):
         self.conn = DtechRS422()
         self.CMD_RF_ENABLE = 0x01
@@ -25,31 +31,24 @@ class RS422_DAQ:
             "H": 0x43
         }
 
-        self.BASE_NUMS = list(range(96, 128, 1))
-        self.DBS = list(range(10, 42, 1))
+        # Status byte -> text, resolved once instead of scanning per status read
+        self.RF_STATE_BY_BYTE = {self.CMD_RF_ENABLE: "ON", self.CMD_RF_DISABLE: "OFF"}
+        self.FAULT_BY_BYTE = {byte: fault for fault, byte in self.FAULTS.items()}
+        self.BAND_BY_BYTE = {byte: band for band, byte in self.BANDS.items()}
 
-        self.read_status_return()
         try:
             self.read_status_return()
             print("DAQ validated")
-        except:
+        except Exception:
             print("Failed to validate daq")
 
     def gain_value_to_hex(self, value):
-        hex_value = ''
-        for index, db in enumerate(self.DBS):
-            if value == db:
-                hex_value = hex(self.BASE_NUMS[index])
-                
-        return hex_value
+        return self._db_to_hex.get(value, '')
     
     def hex_to_gain_value(self, hex_value):
-        gain_value = ''
-        for index, base_value in enumerate(self.BASE_NUMS):
-            if base_value == int(hex_value):
-                gain_value = self.DBS[index]
-
-        return gain_value
+        if isinstance(hex_value, str):
+            hex_value = int(hex_value, 0)
+        return self._hex_to_db.get(int(hex_value), '')
     
     def enable_rf(self):
         self.conn.write_cmd(self.CMD_RF_ENABLE)
@@ -87,24 +86,34 @@ class RS422_DAQ:
         else:
             return f"Gain value is out of operating range: {gain_value}"
 
+    def apply_state(self, band=None, gain=None, rf=None):
+        """Send band, RF and gain commands in one write, then verify with a single status read"""
+        if gain is not None and gain not in self._db_to_hex:
+            return f"Gain value is out of operating range: {gain}"
+
+        cmds = []
+        if band is not None:
+            cmds.append(self.BANDS[band])
+        if rf is not None:
+            cmds.append(self.CMD_RF_ENABLE if rf else self.CMD_RF_DISABLE)
+        if gain is not None:
+            cmds.append(self._db_to_hex[gain])
+        self.conn.write_cmds(cmds)
+
+        rf_on_off, _, bandpath, gain_value, _, _ = self.read_status_return()
+        if ((band is None or bandpath == band)
+                and (rf is None or rf_on_off == ("ON" if rf else "OFF"))
+                and (gain is None or gain_value == gain + 10)):
+            return "COMPLETE"
+        else:
+            return "INCOMPLETE"
+
     def read_status_return(self):   
         byte_arr = self.conn.query_status()
 
-        rf_on_off = ''
-        if byte_arr[0] == self.CMD_RF_ENABLE:
-            rf_on_off = "ON"
-        elif byte_arr[0] == self.CMD_RF_DISABLE:
-            rf_on_off = "OFF"
-
-        fault_status = ''
-        for fault, byte in self.FAULTS.items():
-            if byte == byte_arr[1]:
-                fault_status = fault
-
-        bandpath = ''
-        for band, byte in self.BANDS.items():
-            if byte_arr[2] == byte:
-                bandpath = band
+        rf_on_off = self.RF_STATE_BY_BYTE.get(byte_arr[0], '')
+        fault_status = self.FAULT_BY_BYTE.get(byte_arr[1], '')
+        bandpath = self.BAND_BY_BYTE.get(byte_arr[2], '')
 
         gain_value = self.hex_to_gain_value(byte_arr[3])
 
@@ -139,6 +148,10 @@ class DtechRS422:
 
         self.ser.write([cmd])
 
+    def write_cmds(self, cmds):
+        cmds = [int(cmd, 0) if isinstance(cmd, str) else cmd for cmd in cmds]
+        self.ser.write(cmds)
+
     def query_status(self):
         self.ser.write([0x20])
         buffer = self.ser.read(size=8)
@@ -0,0 +1,12 @@
+"""
+Lynx PA gain setting <-> DAQ command byte tables, shared by RS422_DAQ and SimulatedRS422_DAQ.
+"""
+from types import MappingProxyType
+
+# Command bytes 0x60-0x7F select gains 10-41 dB
+BASE_NUMS = tuple(range(96, 128, 1))
+DBS = tuple(range(10, 42, 1))
+
+# Built once so the drivers index them instead of scanning DBS/BASE_NUMS per call
+DB_TO_HEX = MappingProxyType({db: hex(base) for db, base in zip(DBS, BASE_NUMS)})
+HEX_TO_DB = MappingProxyType({base: db for db, base in zip(DBS, BASE_NUMS)})
@@ -32,6 +32,21 @@ DAQ_SETTINGS = {
     }
 }
 
+# Status table and the simulation flags it was built from; rebuilt when any flag differs
+_STATUS_CACHE = None
+_STATUS_LABELS = None
+_STATUS_KEY = None
+
+# DAQ class resolved by get_daq_instance and the (SIMULATION_MODE, SIMULATE_DAQ) it was resolved for
+_DAQ_CLASS = None
+_DAQ_KEY = None
+
+def reset_daq_cache():
+    """Forget the memoized DAQ class so the next get_daq_instance re-resolves it."""
+    global _DAQ_CLASS, _DAQ_KEY
+    _DAQ_CLASS = None
+    _DAQ_KEY = None
+
 def get_daq_instance():
     """
     Factory function to get the appropriate DAQ instance based on configuration.
@@ -39,17 +54,31 @@ def get_daq_instance():
     Returns:
         DAQ instance (real or simulated)
     """
+    global _DAQ_CLASS, _DAQ_KEY
+    # Scripts may assign the flags directly, so re-resolve whenever they differ
+    key = (SIMULATION_MODE, SIMULATE_DAQ)
+    if _DAQ_CLASS is None or key != _DAQ_KEY:
+        if SIMULATION_MODE or SIMULATE_DAQ:
+            from .simulated_daq import SimulatedRS422_DAQ
+            _DAQ_CLASS = SimulatedRS422_DAQ
+            _DAQ_KEY = key
+        else:
+            try:
+                from .daq import RS422_DAQ
+                _DAQ_CLASS = RS422_DAQ
+                _DAQ_KEY = key
+            except Exception as e:
+                print(f"Failed to import real DAQ, falling back to simulation: {e}")
+                from .simulated_daq import SimulatedRS422_DAQ
+                return SimulatedRS422_DAQ()
     if SIMULATION_MODE or SIMULATE_DAQ:
+        return _DAQ_CLASS()
+    try:
+        return _DAQ_CLASS()
+    except Exception as e:
+        print(f"Failed to initialize real DAQ, falling back to simulation: {e}")
         from .simulated_daq import SimulatedRS422_DAQ
         return SimulatedRS422_DAQ()
-    else:
-        try:
-            from .daq import RS422_DAQ
-            return RS422_DAQ()
-        except Exception as e:
-            print(f"Failed to initialize real DAQ, falling back to simulation: {e}")
-            from .simulated_daq import SimulatedRS422_DAQ
-            return SimulatedRS422_DAQ()
 
 def set_simulation_mode(enable_simulation=True):
     """
@@ -60,24 +89,44 @@ def set_simulation_mode(enable_simulation=True):
     """
     global SIMULATION_MODE
     SIMULATION_MODE = enable_simulation
+    invalidate_hardware_status()
+    reset_daq_cache()
     print(f"Simulation mode {'enabled' if enable_simulation else 'disabled'}")
 
+def invalidate_hardware_status():
+    """Drop the cached status table so the next get_hardware_status rebuilds it."""
+    global _STATUS_CACHE, _STATUS_LABELS, _STATUS_KEY
+    _STATUS_CACHE = None
+    _STATUS_LABELS = None
+    _STATUS_KEY = None
+
 def get_hardware_status():
     """
     Get the current hardware configuration status.
     
     Returns:
-        dict: Current hardware configuration
+        dict: Current hardware configuration (shared; do not modify)
     """
-    return {
-        'simulation_mode': SIMULATION_MODE,
-        'daq': 'simulated' if (SIMULATION_MODE or SIMULATE_DAQ) else 'real',
-        'temp_controller': 'simulated' if (SIMULATION_MODE or SIMULATE_TEMP_CONTROLLER) else 'real',
-        'temp_probe': 'simulated' if (SIMULATION_MODE or SIMULATE_TEMP_PROBE) else 'real',
-        'power_supply': 'simulated' if (SIMULATION_MODE or SIMULATE_POWER_SUPPLY) else 'real',
-        'signal_generator': 'simulated' if (SIMULATION_MODE or SIMULATE_SIGNAL_GENERATOR) else 'real',
-        'network_analyzer': 'simulated' if (SIMULATION_MODE or SIMULATE_NETWORK_ANALYZER) else 'real'
-    }
+    global _STATUS_CACHE, _STATUS_LABELS, _STATUS_KEY
+    # Flags are module globals that scripts may assign directly, so compare them on every call
+    key = (SIMULATION_MODE, SIMULATE_DAQ, SIMULATE_TEMP_CONTROLLER, SIMULATE_TEMP_PROBE,
+           SIMULATE_POWER_SUPPLY, SIMULATE_SIGNAL_GENERATOR, SIMULATE_NETWORK_ANALYZER)
+    if _STATUS_CACHE is None or key != _STATUS_KEY:
+        devices = {
+            'daq': SIMULATE_DAQ,
+            'temp_controller': SIMULATE_TEMP_CONTROLLER,
+            'temp_probe': SIMULATE_TEMP_PROBE,
+            'power_supply': SIMULATE_POWER_SUPPLY,
+            'signal_generator': SIMULATE_SIGNAL_GENERATOR,
+            'network_analyzer': SIMULATE_NETWORK_ANALYZER,
+        }
+        status = {'simulation_mode': SIMULATION_MODE}
+        for device, simulate in devices.items():
+            status[device] = 'simulated' if (SIMULATION_MODE or simulate) else 'real'
+        _STATUS_LABELS = [(device.replace('_', ' ').title(), status[device].upper()) for device in devices]
+        _STATUS_CACHE = status
+        _STATUS_KEY = key
+    return _STATUS_CACHE
 
 def print_hardware_status():
     """Print the current hardware configuration in a readable format."""
@@ -85,9 +134,8 @@ def print_hardware_status():
     print("\n=== Hardware Configuration ===")
     print(f"Global Simulation Mode: {'ON' if status['simulation_mode'] else 'OFF'}")
     print("\nDevice Status:")
-    for device, mode in status.items():
-        if device != 'simulation_mode':
-            print(f"  {device.replace('_', ' ').title()}: {mode.upper()}")
+    for label, mode in _STATUS_LABELS:
+        print(f"  {label}: {mode}")
     print("=" * 31)
 
 if __name__ == "__main__":
@@ -11,14 +11,16 @@ import csv
 import logging
 
 class PNAXNetworkAnalyzer:
-    def __init__(self, address, clear=False):
-        rm = pyvisa.ResourceManager()
+    def __init__(self, address, clear=False, rm=None):
+        rm = rm or pyvisa.ResourceManager()
         self._res = rm.open_resource(address)
         self._res.timeout = 2500
+        # Last cal/state file recalled through load_saved_cal_and_state
+        self._loaded_state = None
         if clear:
-            self._res.write("*CLS")
-            self._res.write("*WAI")
-            self._res.write("*RST")
+            self.send_cmd("*CLS")
+            self.send_cmd("*WAI")
+            self.send_cmd("*RST")
         self.trace_dir = "Lynx"
         print("SuCCEssfull Cionnection")
 
@@ -69,16 +71,12 @@ class PNAXNetworkAnalyzer:
         self.send_cmd(f"CALC{port}:PAR:MNUM {tracenum}")
         self.send_cmd(f"CALC{port}:FORM {format}")
         self.send_cmd(f"OUTP:STAT ON")
-        # Set data transfer format to ASCII
         time.sleep(delay)
         
-        myTraceData = self.query_pna(f"CALC{port}:MEAS{tracenum}:DATA:FDATA?")
-        frequencies = self.query_pna(f"SENS{port}:X?")
-
-        data = myTraceData.split(",")
-        frequencies = frequencies.split(",")
+        # Trace and stimulus come back as binary REAL,64 under one format switch
+        data, frequencies = self.query_binary_traces(f"CALC{port}:MEAS{tracenum}:DATA:FDATA?", f"SENS{port}:X?")
 
-        data = self.convert_sci_num_str_to_float(data, 3)
+        data = [round(value, 3) for value in data]
 
         return data, frequencies
     
@@ -109,17 +107,36 @@ class PNAXNetworkAnalyzer:
 
         return data, frequencies
 
+    def query_binary_traces(self, *queries):
+        """ Queries each trace as little-endian REAL,64 instead of ASCII; the data format is set once for all of them and put back to ASCII after """
+        self.send_cmd("FORM:BORD SWAP")
+        self.send_cmd("FORM:DATA REAL,64")
+        try:
+            return [self._res.query_binary_values(query, datatype="d", is_big_endian=False) for query in queries]
+        finally:
+            self.send_cmd("FORM:DATA ASCii,0")
+
     def send_cmd(self, string):
+        if string.upper().startswith(("*RST", "SYST:PRES")):
+            # A reset/preset discards the recalled cal/state
+            self._loaded_state = None
         self._res.write(string)
 
     def query_pna(self, string):
         response = self._res.query(string)
         return response
     
-    def load_saved_cal_and_state(self, state_filepath):
+    def load_saved_cal_and_state(self, state_filepath, force=False):
+        # The S21 attenuation sweep re-requests the same cal/state file every step; only
+        # send the (multi-second) recall when it differs from the one last loaded.
+        # Callers pass force=True at the start of each sweep so a state changed since
+        # (front panel, preset, another program) is never measured against.
         state_filepath = str(state_filepath)
+        if not force and state_filepath == self._loaded_state:
+            return
         print(state_filepath)
         self.send_cmd(f"MMEM:LOAD:CSAR '{state_filepath}'")
+        self._loaded_state = state_filepath
 
 if __name__ == "__main__":
     na = PNAXNetworkAnalyzer("TCPIP0::K-Instr0000.local::hislip0::INSTR")
@@ -1,10 +1,11 @@
 from pyvisa import ResourceManager
+from pyvisa.errors import VisaIOError
 import time
 
 class E4418BPowerMeter:
 	"""Class for interfacing with Agilent E4418B"""
-	def __init__(self, adrress, name):
-		rm = ResourceManager()
+	def __init__(self, adrress, name, rm=None):
+		rm = rm or ResourceManager()
 		self._name = name
 		self._cable_loss = 0
 		self._res = rm.open_resource(adrress)
@@ -39,7 +40,7 @@ class E4418BPowerMeter:
 			try:
 				reading = self._res.query(":FETCH1:POW:AC? DEF,3,(@1)")
 				measurement_taken = True
-			except:
+			except VisaIOError:
 				time.sleep(3)
 				print("measurement not taken")
 			
@@ -85,8 +85,8 @@ class SerialPowerSupply:
         return fault
 
 class PowerSupply:
-    def __init__(self, visa_address):
-        rm = pyvisa.ResourceManager()
+    def __init__(self, visa_address, rm=None):
+        rm = rm or pyvisa.ResourceManager()
         self._res = rm.open_resource(visa_address)
 
         self.max_voltage = 34.5
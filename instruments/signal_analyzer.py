@@ -8,14 +8,14 @@ import numpy as np
 class MXASignalAnalyzer:
     """Class for interacting with MXA lab bench signal analyzer - Max"""
 
-    def __init__(self, adress, simulate=False, simulated_dut=None, mode='SAN'):
+    def __init__(self, adress, simulate=False, simulated_dut=None, mode='SAN', rm=None):
         self._simulate = simulate
         self._simulated_dut = simulated_dut
         self._mode = mode
         self._name = "MXA"
 
         if not self._simulate:
-            rm = pyvisa.ResourceManager()
+            rm = rm or pyvisa.ResourceManager()
             self._res = rm.open_resource(adress)
             self._res.timeout = 500000
             self._res.write("*CLS")                                  #clear status
@@ -110,7 +110,7 @@ class MXASignalAnalyzer:
 
             time.sleep(5)
 
-            power_resp = self._res.query("READ:CHP2?").split(',')
+            power_resp = self.query_binary_trace("READ:CHP2?")
             center_frequency = float(self._res.query("FREQ:CENT?"))
             span = float(self._res.query("CHP:FREQ:SPAN?")) 
             print("HERE", center_frequency, span)
@@ -121,7 +121,7 @@ class MXASignalAnalyzer:
 
             for idx, power in enumerate(power_resp):
                 freq_bucket.append(start_freq + (idx * step))
-                power_bucket.append(float(power))
+                power_bucket.append(power)
 
             self._res.write("CHP:INIT:CONT 1")
             print(len(power_bucket), len(freq_bucket))
@@ -144,24 +144,24 @@ class MXASignalAnalyzer:
 
             time.sleep(5)
 
-            trace_data = self._res.query(":READ:SAN1?").split(",")
-
-            trace_data_bucket = []
-            freqs = []
-            freq = True
-            for data in trace_data:
-                value = float(data)
-                if freq:
-                    freqs.append(value)
-                    freq = False
-                else:
-                    trace_data_bucket.append(value)
-                    freq = True
+            # Interleaved (frequency, amplitude) pairs
+            trace_data = self.query_binary_trace(":READ:SAN1?")
+            freqs = trace_data[0::2]
+            trace_data_bucket = trace_data[1::2]
 
             # self._res.write(":SAN:INIT:CONT 1")
 
             return freqs, trace_data_bucket
 
+    def query_binary_trace(self, query):
+        """Query trace data as REAL,64 instead of ASCII; restores ASCII since the other READ/MEAS results are parsed as text"""
+        self._res.write(":FORM:BORD SWAP")
+        self._res.write(":FORM:DATA REAL,64")
+        try:
+            return self._res.query_binary_values(query, datatype="d", is_big_endian=False)
+        finally:
+            self._res.write(":FORM:DATA ASCii")
+
     def get_amplitude_offset(self):
         if self._mode != 'SA':
             offset = self._res.query(":SENS:CORR:BTS:RF:GAIN?")
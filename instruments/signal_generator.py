@@ -42,13 +42,13 @@ class SynthesizedCWGenerator:
 
 class E4438CSignalGenerator:
     """General class for interacting with E4438C lab bench signal generator"""
-    def __init__(self, adrress, max_power=0, simulate=False):
+    def __init__(self, adrress, max_power=0, simulate=False, rm=None):
         self._simulate = simulate
         self._running = False
         self._max_power = max_power
         self._current_waveform = None
         if not self._simulate:
-            rm = pyvisa.ResourceManager()
+            rm = rm or pyvisa.ResourceManager()
             self._res = rm.open_resource(adrress)
             self._res.write("*CLS")
             self._res.write("*WAI")
@@ -72,6 +72,22 @@ class E4438CSignalGenerator:
     def start_output(self):
         self._res.write("POW:STAT ON;")
 
+    def setup_bulk(self, frequency=None, amplitude=None, dmod=None, modulation=None, output=None):
+        """Send the given settings as one compound SCPI write (";:"-joined) instead of one write each"""
+        cmds = []
+        if frequency is not None:
+            cmds.append(f"FREQ:FIX {int(frequency)}Hz")
+        if amplitude is not None:
+            cmds.append(f"POW:LEV {amplitude} dBm")
+        if dmod is not None:
+            cmds.append(f"RAD:DMOD:ARB:SET '{dmod}'")
+        if modulation is not None:
+            cmds.append(f"RAD:DMOD:ARB {modulation}")
+        if output:
+            cmds.append("POW:STAT ON")
+        if cmds:
+            self._res.write(";:".join(cmds))
+
     def gen_cw(self, frequency, power):
         """Start generating CW signal"""
         if power > self._max_power:
@@ -2,6 +2,14 @@ import time
 import datetime
 import random
 import ast
+from types import MappingProxyType
+from .daq_gain_codes import BASE_NUMS, DBS, DB_TO_HEX, HEX_TO_DB
+
+# Byte value -> "0xNN" text for the simulated link's command/response logging
+_HEX_BYTE = tuple(f"0x{i:02X}" for i in range(256))
+
+# Fixed 8-byte status reply: RF, fault, band, gain, temp bits 9-5, temp bits 4-0, padding
+_STATUS_RESPONSE = bytes((0x01, 0x20, 0x40, 0x70, 0x80, 0x10, 0x00, 0x00))
 
 class SimulatedRS422_DAQ:
     """
@@ -9,33 +17,40 @@ class SimulatedRS422_DAQ:
     Mimics all functionality of the real DAQ with realistic simulated responses.
     """
     
-    def __init__(self):
+    # Command definitions (same as real DAQ); shared, read-only across instances
+    CMD_RF_ENABLE = 0x01
+    CMD_RF_DISABLE = 0x00
+    CMD_REPORT_STATUS = 0x20
+
+    FAULTS = MappingProxyType({
+        "No Faults": 0x20,
+        "Fault_+5V_Reg_Band_3": 0x21,
+        "Fault_+8V_Reg_Band_2": 0x22,
+        "Fault_+8V_Reg_Band_1": 0x24,
+        "Fault_-5V_Reg": 0x28,
+        "Fault_Command_Error": 0x30
+    })
+
+    BANDS = MappingProxyType({
+        "NONE": 0x40,
+        "L": 0x41,
+        "M": 0x42,
+        "H": 0x43
+    })
+
+    # Faults that can be picked at random by read_status_return
+    _fault_options = tuple(fault for fault in FAULTS if fault != "No Faults")
+
+    BASE_NUMS = BASE_NUMS
+    DBS = DBS
+    _db_to_hex = DB_TO_HEX
+    _hex_to_db = HEX_TO_DB
+
+    def __init__(self, simulate_latency=False):
         # Simulate connection initialization
-        self.conn = SimulatedDtechRS422()
-        
-        # Command definitions (same as real DAQ)
-        self.CMD_RF_ENABLE = 0x01
-        self.CMD_RF_DISABLE = 0x00
-        self.CMD_REPORT_STATUS = 0x20
-
-        self.FAULTS = {
-            "No Faults": 0x20,
-            "Fault_+5V_Reg_Band_3": 0x21,
-            "Fault_+8V_Reg_Band_2": 0x22,
-            "Fault_+8V_Reg_Band_1": 0x24,
-            "Fault_-5V_Reg": 0x28,
-            "Fault_Command_Error": 0x30
-        }
-
-        self.BANDS = {
-            "NONE": 0x40,
-            "L": 0x41,
-            "M": 0x42,
-            "H": 0x43
-        }
-
-        self.BASE_NUMS = list(range(96, 128, 1))
-        self.DBS = list(range(10, 42, 1))
+        self.simulate_latency = simulate_latency
+        self.conn = SimulatedDtechRS422(simulate_latency)
+        self._rng = random.Random()
 
         # Simulated state variables
         self.rf_enabled = False
@@ -44,40 +59,38 @@ class SimulatedRS422_DAQ:
         self.fault_state = "No Faults"
         self.base_temperature = 25.0  # Base temperature in Celsius
         
-        # Initialize and validate
-        self.read_status_return()
+        # Validate
         try:
-            self.read_status_return()
+            self.read_status_return(quiet=True)
             print("Simulated DAQ validated")
         except Exception as e:
             print(f"Failed to validate simulated DAQ: {e}")
 
+    def _delay(self, seconds):
+        """Sleep like the hardware would, only when latency simulation is on"""
+        if self.simulate_latency:
+            time.sleep(seconds)
+
     def gain_value_to_hex(self, value):
         """Convert gain value to hex representation"""
-        hex_value = ''
-        for index, db in enumerate(self.DBS):
-            if value == db:
-                hex_value = hex(self.BASE_NUMS[index])
-                
-        return hex_value
+        return self._db_to_hex.get(value, '')
     
     def hex_to_gain_value(self, hex_value):
         """Convert hex value back to gain value"""
-        gain_value = ''
-        for index, base_value in enumerate(self.BASE_NUMS):
-            if base_value == int(hex_value):
-                gain_value = self.DBS[index]
-
-        return gain_value
+        if isinstance(hex_value, str):
+            hex_value = int(hex_value, 0)
+        return self._hex_to_db.get(int(hex_value), '')
     
-    def enable_rf(self):
-        """Enable RF output"""
+    def enable_rf(self, verify=True):
+        """Enable RF output (verify=False trusts the simulated state and skips the delay and status read)"""
         print("Simulated: Enabling RF")
         self.conn.write_cmd(self.CMD_RF_ENABLE)
         self.rf_enabled = True
+        if not verify:
+            return "COMPLETE"
         
         # Simulate small delay
-        time.sleep(0.1)
+        self._delay(0.1)
         
         rf_on_off, _, _, _, _, _ = self.read_status_return()
 
@@ -88,22 +101,25 @@ class SimulatedRS422_DAQ:
             print("Simulated: RF enable failed")
             return "INCOMPLETE"
         
-    def disable_rf(self):
-        """Disable RF output"""
+    def disable_rf(self, verify=True):
+        """Disable RF output (verify=False skips the settle delay)"""
         print("Simulated: Disabling RF")
         self.conn.write_cmd(self.CMD_RF_DISABLE)
         self.rf_enabled = False
-        time.sleep(0.1)
+        if verify:
+            self._delay(0.1)
 
-    def set_band(self, band):
-        """Set the frequency band"""
+    def set_band(self, band, verify=True):
+        """Set the frequency band (verify=False trusts the simulated state and skips the delay and status read)"""
         try:
             print(f"Simulated: Setting band to {band}")
             self.conn.write_cmd(self.BANDS[band])
             self.current_band = band
+            if not verify:
+                return "COMPLETE"
             
             # Simulate small delay
-            time.sleep(0.1)
+            self._delay(0.1)
             
             _, _, bandpath, _, _, _ = self.read_status_return()
             if bandpath == band:
@@ -117,16 +133,18 @@ class SimulatedRS422_DAQ:
             print(f"FAILED TO SET BAND TO: {band}")
             return "INCOMPLETE"
 
-    def change_gain(self, init_gain_value):
-        """Change the gain value"""
+    def change_gain(self, init_gain_value, verify=True):
+        """Change the gain value (verify=False trusts the simulated state and skips the delay and status read)"""
         if init_gain_value <= 41:
             print(f"Simulated: Setting gain to {init_gain_value}")
             msg = self.gain_value_to_hex(init_gain_value)
             self.conn.write_cmd(msg)
             self.current_gain = init_gain_value
+            if not verify:
+                return "COMPLETE"
             
             # Simulate small delay
-            time.sleep(0.1)
+            self._delay(0.1)
             
             _, _, _, gain_value, _, _ = self.read_status_return()
             if gain_value == init_gain_value + 10:
@@ -140,21 +158,52 @@ class SimulatedRS422_DAQ:
             print(f"Simulated error: {error_msg}")
             return error_msg
 
-    def read_status_return(self):   
-        """Read and return current status - simulated version"""
+    def apply_state(self, band=None, gain=None, rf=None):
+        """Send band, RF and gain commands in one write, then verify with a single status read"""
+        if gain is not None and gain not in self._db_to_hex:
+            error_msg = f"Gain value is out of operating range: {gain}"
+            print(f"Simulated error: {error_msg}")
+            return error_msg
+
+        cmds = []
+        if band is not None:
+            cmds.append(self.BANDS[band])
+            self.current_band = band
+        if rf is not None:
+            cmds.append(self.CMD_RF_ENABLE if rf else self.CMD_RF_DISABLE)
+            self.rf_enabled = bool(rf)
+        if gain is not None:
+            cmds.append(self._db_to_hex[gain])
+            self.current_gain = gain
+        print(f"Simulated: Applying state band={band} rf={rf} gain={gain}")
+        self.conn.write_cmds(cmds)
+
+        # Simulate small delay
+        self._delay(0.1)
+
+        rf_on_off, _, bandpath, gain_value, _, _ = self.read_status_return()
+        if ((band is None or bandpath == band)
+                and (rf is None or rf_on_off == ("ON" if rf else "OFF"))
+                and (gain is None or gain_value == gain + 10)):
+            return "COMPLETE"
+        else:
+            print("Simulated: State apply failed")
+            return "INCOMPLETE"
+
+    def read_status_return(self, quiet=False):   
+        """Read and return current status - simulated version (quiet skips the status prints)"""
         # Simulate communication delay
-        time.sleep(0.01)
+        self._delay(0.01)
         
-        byte_arr = self.conn.query_status()
+        byte_arr = self.conn.query_status(quiet)
 
         # Parse RF status
         rf_on_off = "ON" if self.rf_enabled else "OFF"
 
         # Simulate occasional faults (1% chance)
-        if random.random() < 0.01:
-            fault_options = list(self.FAULTS.keys())
-            fault_options.remove("No Faults")
-            self.fault_state = random.choice(fault_options)
+        rng = self._rng
+        if rng.random() < 0.01:
+            self.fault_state = rng.choice(self._fault_options)
         else:
             self.fault_state = "No Faults"
 
@@ -166,13 +215,14 @@ class SimulatedRS422_DAQ:
 
         # Generate simulated temperature reading
         # Add some realistic variation around base temperature
-        temp_variation = random.uniform(-2.0, 3.0)  # Realistic temperature drift
+        temp_variation = rng.uniform(-2.0, 3.0)  # Realistic temperature drift
         temp_value = self.base_temperature + temp_variation
 
         # Current timestamp
         date_string = datetime.datetime.now()
 
-        print(f"Simulated Status: RF={rf_on_off}, Band={bandpath}, Gain={gain_value}dB, Temp={temp_value:.1f}°C")
+        if not quiet:
+            print(f"Simulated Status: RF={rf_on_off}, Band={bandpath}, Gain={gain_value}dB, Temp={temp_value:.1f}°C")
 
         return rf_on_off, self.fault_state, bandpath, gain_value, date_string, temp_value
 
@@ -195,9 +245,10 @@ class SimulatedDtechRS422:
     Mimics serial communication without requiring actual hardware.
     """
     
-    def __init__(self):
+    def __init__(self, simulate_latency=False):
         self.port = "SIMULATED_COM4"
         self.connected = True
+        self.simulate_latency = simulate_latency
         print(f"Simulated: Connected to {self.port}")
         
         # Simulate connection parameters
@@ -207,36 +258,39 @@ class SimulatedDtechRS422:
         self.timeout = 1
         self.bytesize = 8
 
+    def _delay(self, seconds):
+        """Sleep like the serial link would, only when latency simulation is on"""
+        if self.simulate_latency:
+            time.sleep(seconds)
+
     def write_cmd(self, cmd):
         """Simulate writing a command"""
         if isinstance(cmd, str):
             cmd = int(cmd, 0)
         
         # Simulate command processing delay
-        time.sleep(0.001)
-        print(f"Simulated: Sent command 0x{cmd:02X}")
+        self._delay(0.001)
+        print("Simulated: Sent command " + _HEX_BYTE[cmd & 0xFF])
+
+    def write_cmds(self, cmds):
+        """Simulate writing several commands in one transfer"""
+        cmds = [int(cmd, 0) if isinstance(cmd, str) else cmd for cmd in cmds]
 
-    def query_status(self):
+        # Simulate command processing delay
+        self._delay(0.001)
+        print("Simulated: Sent commands " + " ".join(_HEX_BYTE[cmd & 0xFF] for cmd in cmds))
+
+    def query_status(self, quiet=False):
         """Simulate status query response"""
         # Simulate communication delay
-        time.sleep(0.005)
+        self._delay(0.005)
         
         # Return simulated 8-byte response
         # This would normally come from the actual hardware
-        simulated_response = bytearray([
-            0x01,  # RF status byte
-            0x20,  # Fault status byte
-            0x40,  # Band byte
-            0x70,  # Gain byte
-            0x80,  # Temperature bits 9-5
-            0x10   # Temperature bits 4-0
-        ])
-        
-        # Pad to 8 bytes
-        while len(simulated_response) < 8:
-            simulated_response.append(0x00)
+        simulated_response = _STATUS_RESPONSE
             
-        print(f"Simulated: Received status response: {[hex(b) for b in simulated_response]}")
+        if not quiet:
+            print(f"Simulated: Received status response: {[_HEX_BYTE[b] for b in simulated_response]}")
         return simulated_response
     
     def bin_format(self, integer):
@@ -250,19 +304,20 @@ class DAQFactory:
     """
     
     @staticmethod
-    def create_daq(simulate=True):
+    def create_daq(simulate=True, latency=False):
         """
         Create a DAQ instance.
         
         Args:
             simulate (bool): If True, creates simulated DAQ. If False, creates real DAQ.
+            latency (bool): If True, the simulated DAQ sleeps like real hardware would.
             
         Returns:
             DAQ instance (simulated or real)
         """
         if simulate:
             print("Creating simulated DAQ...")
-            return SimulatedRS422_DAQ()
+            return SimulatedRS422_DAQ(simulate_latency=latency)
         else:
             print("Creating real DAQ...")
             try:
@@ -272,18 +327,18 @@ class DAQFactory:
             except ImportError as e:
                 print(f"Failed to import real DAQ: {e}")
                 print("Falling back to simulated DAQ...")
-                return SimulatedRS422_DAQ()
+                return SimulatedRS422_DAQ(simulate_latency=latency)
             except Exception as e:
                 print(f"Failed to initialize real DAQ: {e}")
                 print("Falling back to simulated DAQ...")
-                return SimulatedRS422_DAQ()
+                return SimulatedRS422_DAQ(simulate_latency=latency)
 
 if __name__ == "__main__":
     # Demo the simulated DAQ
     print("=== Simulated DAQ Demo ===")
     
     # Create simulated DAQ
-    daq = SimulatedRS422_DAQ()
+    daq = SimulatedRS422_DAQ(simulate_latency=True)
     
     # Test basic operations
     print("\n--- Testing RF Control ---")
@@ -27,8 +27,8 @@ class DracalTempProbe:
         
 
 class Agilent34401A:
-    def __init__(self, resource_name):
-        self.rm = pyvisa.ResourceManager()
+    def __init__(self, resource_name, rm=None):
+        self.rm = rm or pyvisa.ResourceManager()
         self.instrument = self.rm.open_resource(resource_name)
 
     def identify(self):
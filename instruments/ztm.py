@@ -50,8 +50,12 @@ class ZtmModular:
         print(switch_number, state)
         
     def set_all_switches(self, states):
-        for switch, state in enumerate(states):
-            self.set_switch_state(switch + 1, state)
+        # Only drive switches whose confirmed state differs; moving between the S21/S11/S22
+        # switchpaths of one path usually changes just one or two of them
+        for index, state in enumerate(states):
+            switch = self.get_switch(index + 1)
+            if switch is None or switch.state != state:
+                self.set_switch_state(index + 1, state)
         
     def reset_all_switches(self):
         for i in range(1, len(self.switches) + 1):
@@ -72,7 +76,7 @@ class ZtmModular:
 
 class SP4T:
     def __init__(self, switch_number):
-        self.state = 0
+        self.state = None  # unknown until set through set_switch_state
         self.switch_number = switch_number
 
     def set_state(self, state):
@@ -83,7 +87,7 @@ class SP4T:
             
 class SP6T:
     def __init__(self, switch_number):
-        self.state = 0
+        self.state = None  # unknown until set through set_switch_state
         self.switch_number = switch_number
 
     def set_state(self, state):
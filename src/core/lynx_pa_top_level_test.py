@@ -1,25 +1,20 @@
 
 import time
-from instruments.power_meter import E4418BPowerMeter, GigatronixPowerMeter
-from instruments.signal_generator import SynthesizedCWGenerator, E4438CSignalGenerator
+from instruments.power_meter import E4418BPowerMeter
+from instruments.signal_generator import E4438CSignalGenerator
 from instruments.power_supply import PowerSupply
 from instruments.daq import RS422_DAQ
-from instruments.temp_probe import DracalTempProbe, Agilent34401A
-from configs.calibration import Calibration
-from instruments.temp_controller import TempController
+from instruments.temp_probe import Agilent34401A
 from instruments.ztm import ZtmModular
 from instruments.signal_analyzer import MXASignalAnalyzer
 from instruments.network_analyzer import PNAXNetworkAnalyzer
-from instruments.AIOUSB.aiousb import Aiousb
-from instruments.daq import RS422_DAQ
 from instruments.simulated_daq import SimulatedRS422_DAQ
-from configs.calibration import Calibration
-from configs.scribe import Scribe
 from configs.configs import LynxPaConfig
 import datetime
-import csv
 import logging
-import os
+
+logger = logging.getLogger("Test")
+_now = datetime.datetime.now  # bound once; stamped on every measurement bucket
 
 def change_atenuator_to_gain(attenuator_value):
     """ Converts an attenuator value to a gain value """
@@ -28,168 +23,146 @@ def change_atenuator_to_gain(attenuator_value):
     return 41 - attenuator_value
 
 
-class RfTest:
+def _assign_instruments(test, fields, values):
+    """ Sets each (name, types) field on test from values; raises TypeError(name) on a wrong instrument type """
+    for name, types in fields:
+        value = values[name]
+        if not isinstance(value, types):
+            raise TypeError(name)
+        setattr(test, name, value)
+
+class TelemetryMixin:
+    """ PSU and temp probe reads shared by the test classes; expects psu, temp_probe and temp_probe2 """
+    def get_voltage_and_current(self):
+        current = self.psu.get_current()
+        voltage = self.psu.get_voltage()
+
+        return voltage, current 
+    
+    def get_temp_data(self):
+        probe_temp_value = self.temp_probe.measure_temp()
+        probe_temp_value2 = self.temp_probe2.measure_temp()
+        logger.debug("Probe temps: %s, %s", probe_temp_value, probe_temp_value2)
+
+        return probe_temp_value, probe_temp_value2
+
+class RfTest(TelemetryMixin):
     def __init__(self, rfpm1_input="SIM", rfpm2_output="SIM", rfsg="SIM", psu="SIM", daq="SIM", temp_probe="SIM", temp_probe2="SIM", temp_controller="SIM", sno="SIM", switch_bank="SIM", na="SIM"):
-        self.logger = logging.getLogger("Test")
+        self.logger = logger
         self.logger.setLevel(logging.DEBUG)
         
         self.sno = sno
         self.name = ""
 
 class SignalAnalyzerTest(RfTest):
-    def __init__(self, rfpm2_input="SIM", rfpm1_output="SIM" , rfsa="SIM", rfsg="SIM", psu="SIM", daq="SIM", temp_probe="SIM", temp_probe2="SIM", sno="SIM", switch_bank="SIM", config="SIM"):
-        if isinstance(rfpm2_input, E4418BPowerMeter):
-            self.rfpm2_input = rfpm2_input
-            # self.logger.debug("Succesfully connected to rfpm1 (E4418BPowerMeter)")
-        else:
-            raise TypeError()
-        
-        if isinstance(rfpm1_output, E4418BPowerMeter):
-            self.rfpm1_output = rfpm1_output
-            # self.logger.debug("Succesfully connected to rfpm2 (E4418BPowerMeter)")
-        else:
-            raise TypeError()
-        
-        if isinstance(psu, PowerSupply):
-            self.psu = psu
-        else:
-            raise TypeError()
-        
-        if isinstance(rfsa, MXASignalAnalyzer):
-            self.rfsa = rfsa
-        else:
-            raise TypeError()
+    # (attribute, accepted instrument types) checked and assigned by __init__
+    _FIELDS = (
+        ("rfpm2_input", (E4418BPowerMeter,)),
+        ("rfpm1_output", (E4418BPowerMeter,)),
+        ("psu", (PowerSupply,)),
+        ("rfsa", (MXASignalAnalyzer,)),
+        ("rfsg", (E4438CSignalGenerator,)),
+        ("daq", (RS422_DAQ, SimulatedRS422_DAQ)),
+        ("temp_probe", (Agilent34401A,)),
+        ("temp_probe2", (Agilent34401A,)),
+        ("switch_bank", (ZtmModular,)),
+        ("config", (LynxPaConfig,)),
+    )
 
-        if isinstance(rfsg, E4438CSignalGenerator):
-            self.rfsg = rfsg
-            # self.logger.debug("Successfully connected to rfsg (SynthesizedCWGenerator)")
-        else:
-            raise TypeError()
-        
-        if isinstance(daq, RS422_DAQ) or isinstance(daq, SimulatedRS422_DAQ):
-            self.daq = daq
-        else:
-            raise TypeError
-
-        if isinstance(temp_probe, Agilent34401A):
-            self.temp_probe = temp_probe
-        else:
-            raise TypeError
-        
-        if isinstance(temp_probe2, Agilent34401A):
-            self.temp_probe2 = temp_probe2
-        else:
-            raise TypeError
-        
-        if isinstance(switch_bank, ZtmModular):
-            self.switch_bank = switch_bank
-        else:
-            raise TypeError
-
-        if isinstance(config, LynxPaConfig):
-            self.config = config
-        else:
-            raise TypeError
+    def __init__(self, rfpm2_input="SIM", rfpm1_output="SIM" , rfsa="SIM", rfsg="SIM", psu="SIM", daq="SIM", temp_probe="SIM", temp_probe2="SIM", sno="SIM", switch_bank="SIM", config="SIM"):
+        _assign_instruments(self, self._FIELDS, locals())
         
         self.sno = sno
         self.name = ""
 
 class NetworkAnalyzerTest(RfTest):
+    # (attribute, accepted instrument types) checked and assigned by __init__
+    _FIELDS = (
+        ("na", (PNAXNetworkAnalyzer,)),
+        ("psu", (PowerSupply,)),
+        ("daq", (RS422_DAQ, SimulatedRS422_DAQ)),
+        ("temp_probe", (Agilent34401A,)),
+        ("temp_probe2", (Agilent34401A,)),
+        ("switch_bank", (ZtmModular,)),
+        ("config", (LynxPaConfig,)),
+    )
+
     def __init__(self, na="SIM", psu="SIM", daq="SIM", temp_probe="SIM", temp_probe2="SIM", sno="SIM", switch_bank="SIM", config="SIM"):
-        if isinstance(na, PNAXNetworkAnalyzer):
-            self.na = na
-        else:
-            raise TypeError()
-        
-        if isinstance(psu, PowerSupply):
-            self.psu = psu
-        else:
-            raise TypeError()
-        
-        if isinstance(daq, RS422_DAQ) or isinstance(daq, SimulatedRS422_DAQ):
-            self.daq = daq
-        else:
-            raise TypeError
-        
-        if isinstance(temp_probe, Agilent34401A):
-            self.temp_probe = temp_probe
-        else:
-            raise TypeError
-        
-        if isinstance(temp_probe2, Agilent34401A):
-            self.temp_probe2 = temp_probe2
-        else:
-            raise TypeError
-        
-        if isinstance(switch_bank, ZtmModular):
-            self.switch_bank = switch_bank
-        else:
-            raise TypeError
-        
-        if isinstance(config, LynxPaConfig):
-            self.config = config
-        else:
-            raise TypeError
+        _assign_instruments(self, self._FIELDS, locals())
         
         self.sno = sno
         self.name = ""
 
 class BandwithPowerModuleTest(SignalAnalyzerTest):
+    # Set False to skip the live trace window (e.g. headless runs)
+    plot_traces = True
+    # Channel power trace resolution; e.g. 101 points / 10 averages for a coarse sweep
+    sweep_points = 401
+    sweep_avg = 100
+
     def __init__(self, rfpm1="SIM", rfpm2="SIM", rfsg="SIM", psu="SIM", daq="SIM", temp_probe="SIM", temp_probe2="SIM", sno="SIM", switch_bank="SIM", config="SIM", rfsa="SIM"): 
         super().__init__(rfpm2_input=rfpm2, rfpm1_output=rfpm1, rfsg=rfsg, rfsa=rfsa, psu=psu, daq=daq, temp_probe=temp_probe, temp_probe2=temp_probe2, sno=sno, switch_bank=switch_bank, config=config) 
+        # Created on the first plot_trace call and redrawn in place afterwards
+        self._trace_fig = None
+        self._trace_ax = None
 
-    def recover_test_state(self, switchpath, bandwidth, frequency, gain_setting, waveform, input_loss):
+    def recover_test_state(self, bandpath, switchpath, bandwidth, frequency, gain_setting, waveform, input_loss, plot=False):
         self.switch_bank.set_all_switches(switchpath)
         
-        rfsg_input_power = self.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
+        self.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
 
-        self.rfsg.set_frequency(frequency=frequency)
-        self.rfsg.set_amplitude(rfsg_input_power)
-
-        self.set_up_measurement(frequency=frequency, gain_setting=gain_setting, waveform=waveform)
+        self.set_up_measurement(bandpath=bandpath, frequency=frequency, gain_setting=gain_setting, waveform=waveform)
 
         if isinstance(bandwidth, list):
-            self.set_freq_and_bandwidth(freq=frequency, bandwidth=bandwidth, wideband=True)
+            self.set_freq_and_bandwidth(freq=frequency, bandwidth=bandwidth, wideband=True, plot=plot)
         else:
-            print("SHIT")
-            self.set_freq_and_bandwidth(freq=frequency, bandwidth=bandwidth)
+            self.set_freq_and_bandwidth(freq=frequency, bandwidth=bandwidth, plot=plot)
         
-    def set_freq_and_bandwidth(self, freq, bandwidth, wideband=False):
-        import matplotlib.pyplot as plt
-
-        def plot_array(freqs, trace, title="Array Plot", xlabel="Index", ylabel="Value"):
-            plt.figure(figsize=(10, 5))
-            plt.plot(freqs, trace)
-            plt.title(title)
-            plt.xlabel(xlabel)
-            plt.ylabel(ylabel)
-            plt.grid(True)
-            plt.tight_layout()
-            plt.show()
-
+    def set_freq_and_bandwidth(self, freq, bandwidth, wideband=False, plot=False):
         if wideband:
             frequencies, powers = self.rfsa.get_sa_bandwidth_trace(start=bandwidth[0], stop=bandwidth[1])
         else:
-            frequencies, powers = self.rfsa.get_channel_power_data(center=freq, span=bandwidth, points=401, avg=100)
-
-        plot_array(freqs=frequencies, trace=powers)
+            frequencies, powers = self.rfsa.get_channel_power_data(center=freq, span=bandwidth, points=self.sweep_points, avg=self.sweep_avg)
+
+        if plot:
+            self.plot_trace(freqs=frequencies, trace=powers)
+
+        return frequencies, powers
+
+    def plot_trace(self, freqs, trace, title="Array Plot", xlabel="Index", ylabel="Value"):
+        """ Redraws the trace into one reused, non-blocking figure; no-op when plot_traces is False """
+        if not self.plot_traces:
+            return
+
+        if self._trace_fig is None:
+            import matplotlib.pyplot as plt
+            self._trace_fig, self._trace_ax = plt.subplots(num="Signal Analyzer Trace", figsize=(10, 5))
+            plt.show(block=False)
+
+        ax = self._trace_ax
+        ax.clear()
+        ax.plot(freqs, trace)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.grid(True)
+        self._trace_fig.tight_layout()
+        self._trace_fig.canvas.draw_idle()
+        self._trace_fig.canvas.flush_events()
 
     def set_up_measurement(self, bandpath, frequency, gain_setting, waveform, harmonic=False):
-        print(f"Setting up measurement @ FREQ:{frequency} GAIN SETTING:{gain_setting} WAVEFORM: {waveform}")
+        logger.debug("Setting up measurement @ FREQ:%s GAIN SETTING:%s WAVEFORM: %s", frequency, gain_setting, waveform)
 
         if waveform == "CW":
             self.rfsg.enable_modulation("OFF")
         elif waveform == "OQPSK":
-            self.rfsg.select_demod_filter(waveform)
-            self.rfsg.enable_modulation("ON")
+            self.rfsg.setup_bulk(dmod=waveform, modulation="ON")
 
-        self.daq.set_band(bandpath)
-        self.daq.enable_rf()
-        self.daq.change_gain(change_atenuator_to_gain(gain_setting))
+        self.daq.apply_state(band=bandpath, rf=True, gain=change_atenuator_to_gain(gain_setting))
 
         # self.rfsa.auto_set_reference_level()
 
-        print("Completed setting up measurement")
+        logger.debug("Completed setting up measurement")
 
     def input_power_validation(self, frequency, target_power, start_power, input_loss):
         # Calibration Stage Making sure -10 is going into the unit
@@ -197,65 +170,77 @@ class BandwithPowerModuleTest(SignalAnalyzerTest):
         self.rfpm1_output.set_frequency(frequency)
 
         rfsg_input_power = start_power
-        self.rfsg.set_frequency(frequency)
-        self.rfsg.set_amplitude(rfsg_input_power)
-        self.rfsg.start_output()
+        self.rfsg.setup_bulk(frequency=frequency, amplitude=rfsg_input_power, output=True)
 
         time.sleep(1)
 
-        power_increments = [1, .5, .25, .1, .75]
-        power_inc_index = 0
-
-        power_delta = 10000
         power_delta_limit = .1
+        max_iterations = 10
 
         output_power = self.rfpm2_input.get_power_measurement() + input_loss
-
-        while power_delta > power_delta_limit:
-            if power_delta > power_increments[power_inc_index]:
-                inc = power_increments[power_inc_index]
-            else:
-                if power_inc_index != len(power_increments) - 1:
-                    power_inc_index += 1
-                    inc = power_increments[power_inc_index]
-                else:
-                    inc = power_increments[power_inc_index]
-
-            if target_power - output_power < 0:
-                print("Increasing power")
-                rfsg_input_power -= inc
-            else:
-                print("Decreasing power")
-                rfsg_input_power += inc
-
+        power_delta = abs(target_power - output_power)
+
+        # Input path is passive, so measured power tracks the generator ~1 dB/dB.
+        # Jump by the remaining error over the measured slope instead of fixed steps.
+        slope = 1.0
+        iterations = 0
+        while power_delta > power_delta_limit and iterations < max_iterations:
+            step = (target_power - output_power) / slope
+            rfsg_input_power += step
             self.rfsg.set_amplitude(rfsg_input_power)
+            time.sleep(.2)
 
+            previous_power = output_power
             output_power = self.rfpm2_input.get_power_measurement() + input_loss
+            if abs(step) > 1e-3:
+                # Keep the slope estimate sane so one noisy reading can't throw the next jump
+                slope = min(max((output_power - previous_power) / step, 0.5), 2.0)
 
-            power_delta = abs(target_power - output_power)  
-            print(f"INPUT POWER VALIDATION (output_power: {output_power}, power_delta: {power_delta})")
-            time.sleep(.2)
+            power_delta = abs(target_power - output_power)
+            iterations += 1
+            logger.debug("INPUT POWER VALIDATION (output_power: %s, power_delta: %s)", output_power, power_delta)
 
-        print(f"INPUT POWER VALIDATION COMPLETE (output_power: {output_power}, power_delta: {power_delta})")
+        if power_delta > power_delta_limit:
+            logger.warning("INPUT POWER VALIDATION NOT CONVERGED after %s iterations (output_power: %s, power_delta: %s, limit: %s)", iterations, output_power, power_delta, power_delta_limit)
+        else:
+            logger.info("INPUT POWER VALIDATION COMPLETE (output_power: %s, power_delta: %s)", output_power, power_delta)
+        # The rfsg is left at frequency and the returned amplitude, so callers need not set them again
         return rfsg_input_power
     
+    def wait_until_settled(self, read_fn, tol=0.05, readings=3, min_dwell=2.0, max_wait=10.0):
+        """ Reads read_fn until the last `readings` values span no more than tol and at least min_dwell
+        seconds have passed (or max_wait seconds pass); returns the last reading.
+        read_fn paces itself (the E4418B read blocks ~1 s), so there is no extra poll sleep """
+        window = []
+        start = time.monotonic()
+        while True:
+            window.append(read_fn())
+            del window[:-readings]
+            elapsed = time.monotonic() - start
+            # A spread bound over several readings also catches a slow drift that two back-to-back reads miss
+            if elapsed >= min_dwell and len(window) == readings and max(window) - min(window) <= tol:
+                return window[-1]
+            if elapsed >= max_wait:
+                logger.warning("Output power NOT SETTLED after %.1f s (last readings: %s, tol: %s)", elapsed, window, tol)
+                return window[-1]
+
     def clean_up_measurement(self):
         self.rfsg.stop()
         self.daq.disable_rf()
         self.switch_bank.reset_all_switches()
 
     def get_standard_bandwidth_by_frequency(self, bandpath, frequency, bandwidth, waveform, gain_setting):
-        print("FREQ ", frequency)
+        logger.debug("Standard bandwidth @ FREQ:%s", frequency)
         # self.rfsa.load_saved_cal_and_state_from_register(1)
         self.set_up_measurement(bandpath, frequency=frequency, waveform=waveform, gain_setting=gain_setting)
 
         time.sleep(5)
-        frequencies, powers = self.rfsa.get_channel_power_data(center=frequency, span=bandwidth, points=401, avg=100)
+        frequencies, powers = self.rfsa.get_channel_power_data(center=frequency, span=bandwidth, points=self.sweep_points, avg=self.sweep_avg)
         voltage, current = self.get_voltage_and_current()
         probe_temp_value, probe_temp_value2 = self.get_temp_data()
         rf_on_off, fault_status, bandpath, gain_value, date_string, temp_value = self.daq.read_status_return()
 
-        date_string = datetime.datetime.now()
+        date_string = _now()
         
         standard_bucket = {
             "frequency_center":frequency,
@@ -316,17 +301,14 @@ class BandwithPowerModuleTest(SignalAnalyzerTest):
     
     def get_power_meter_by_frequency_and_switchpath(self, bandpath, frequency, waveform, gain_setting, output_loss):
         self.set_up_measurement(bandpath=bandpath, frequency=frequency, waveform=waveform, gain_setting=gain_setting)
-        #NEED FOR
-        time.sleep(10)
-
-
-        rfpm1_output_power = self.rfpm1_output.get_power_measurement()
-        print(rfpm1_output_power)
+        # Output needs to settle after the DAQ state change before it is recorded
+        rfpm1_output_power = self.wait_until_settled(self.rfpm1_output.get_power_measurement, max_wait=10.0)
+        logger.debug("RFPM1 output power: %s", rfpm1_output_power)
 
         voltage, current = self.get_voltage_and_current()
         probe_temp_value, probe_temp_value2 = self.get_temp_data()
         rf_on_off, fault_status, bandpath, gain_value, date_string, temp_value = self.daq.read_status_return()
-        date_string = datetime.datetime.now()
+        date_string = _now()
 
         rfpm1_bucket = {
             "frequency_center": frequency,
@@ -349,96 +331,45 @@ class BandwithPowerModuleTest(SignalAnalyzerTest):
 
         return rfpm1_bucket
 
-
-    def get_voltage_and_current(self):
-        current = self.psu.get_current()
-        voltage = self.psu.get_voltage()
-
-        return voltage, current 
-    
-    def get_temp_data(self):
-        probe_temp_value = self.temp_probe.measure_temp()
-        print(f"Probe Temp Value: {probe_temp_value}")
-
-        probe_temp_value2 = self.temp_probe2.measure_temp()
-        print(f"Probe Temp Value 2: {probe_temp_value2}")
-
-        return probe_temp_value, probe_temp_value2
-
 class NetworkAnalyzerModuleTest(NetworkAnalyzerTest):
     def __init__(self, na="SIM", psu="SIM", daq="SIM", temp_probe="SIM", temp_probe2="SIM", sno="SIM", switch_bank="SIM", config="SIM"):
         super().__init__(na, psu, daq, temp_probe, temp_probe2, sno, switch_bank, config)
         self.name = "Network Analyzer Standard Test"
 
-    def set_up_measurement(self, bandpath, gain_setting, statefilepath):
-        print("Setting up measurement")
-        self.na.load_saved_cal_and_state(statefilepath)
+    def set_up_measurement(self, bandpath, gain_setting, statefilepath, force_state=False):
+        logger.debug("Setting up measurement")
+        self.na.load_saved_cal_and_state(statefilepath, force=force_state)
 
-        self.daq.set_band(bandpath)
-        self.daq.enable_rf()
-        self.daq.change_gain(change_atenuator_to_gain(gain_setting))
-        print("Completed setting up measurement")
+        self.daq.apply_state(band=bandpath, rf=True, gain=change_atenuator_to_gain(gain_setting))
+        logger.debug("Completed setting up measurement")
         time.sleep(5)
 
     def clean_up_measurement(self):
         self.daq.disable_rf()
 
-    def get_ratioed_power_measurement(self, bandpath, gain_setting, ratioed_power, format, statefilepath):
-        gain_bucket = []
-        self.set_up_measurement(bandpath, gain_setting, statefilepath=statefilepath)
+    def get_ratioed_power_measurement(self, bandpath, gain_setting, ratioed_power, format, statefilepath, force_state=False):
+        buckets = self.get_ratioed_power_measurements(bandpath, gain_setting, ratioed_power, (format,), statefilepath, force_state=force_state)
+        return buckets[0] if buckets else []
+
+    def get_ratioed_power_measurements(self, bandpath, gain_setting, ratioed_power, formats, statefilepath, force_state=False):
+        """ Sets up once and reads one trace per format (e.g. ("MLOG", "PHASE")) from the same sweep; returns a bucket per format.
+        force_state recalls the cal/state file even if it is the last one loaded """
+        self.set_up_measurement(bandpath, gain_setting, statefilepath=statefilepath, force_state=force_state)
         rf_on_off, fault_status, bandpath, gain_value, date_string, temp_value = self.daq.read_status_return()
 
 
-        if ratioed_power == "S11":
-            voltage, current = self.get_voltage_and_current()
-            probe_temp_value, probe_temp_value2 = self.get_temp_data()
-            gain, freqs = self.na.calc_and_stream_trace(1, 1, format)
-            gain_bucket = {
-            "gain_setting":gain_setting,
-            "freqs":freqs,
-            "gain":gain,
-            "datetime_string":date_string,
-            "temp_probe1_value": probe_temp_value,
-            "temp_probe2_value": probe_temp_value2,
-            "voltage": voltage,
-            "current": current,
-            "rf_on_off": rf_on_off,
-            "fault_status": fault_status,
-            "bandpath": bandpath,
-            "gain_value": gain_value,
-            "temp_value": temp_value
-            }
-            
-        elif ratioed_power == "S22":
-            voltage, current = self.get_voltage_and_current()
-            probe_temp_value, probe_temp_value2 = self.get_temp_data()
-            date_string = datetime.datetime.now()
-            gain, freqs = self.na.calc_and_stream_trace(1, 1, format)
-
-            gain_bucket = {
-            "gain_setting":gain_setting,
-            "freqs":freqs,
-            "gain":gain,
-            "datetime_string":date_string,
-            "temp_probe1_value": probe_temp_value,
-            "temp_probe2_value": probe_temp_value2,
-            "voltage": voltage,
-            "current": current,
-            "rf_on_off": rf_on_off,
-            "fault_status": fault_status,
-            "bandpath": bandpath,
-            "gain_value": gain_value,
-            "temp_value": temp_value
-            }
-        elif ratioed_power == "S21":
-            voltage, current = self.get_voltage_and_current()
-            probe_temp_value, probe_temp_value2 = self.get_temp_data()
+        if ratioed_power not in ("S11", "S22", "S21"):
+            return []
 
-            date_string = datetime.datetime.now()
+        voltage, current = self.get_voltage_and_current()
+        probe_temp_value, probe_temp_value2 = self.get_temp_data()
+        date_string = _now()
 
+        buckets = []
+        for format in formats:
             gain, freqs = self.na.calc_and_stream_trace(1, 1, format)
 
-            gain_bucket = {
+            buckets.append({
             "gain_setting":gain_setting,
             "freqs":freqs,
             "gain":gain,
@@ -452,25 +383,11 @@ class NetworkAnalyzerModuleTest(NetworkAnalyzerTest):
             "bandpath": bandpath,
             "gain_value": gain_value,
             "temp_value": temp_value
-            }
+            })
 
-        return gain_bucket
+        return buckets
 
     def recover_test_state(self, bandpath, switchpath, gain_setting, statefile_path):
         self.switch_bank.set_all_switches(switchpath)
-        self.set_up_measurement(bandpath=bandpath, gain_setting=gain_setting, statefilepath=statefile_path)
-
-    def get_voltage_and_current(self):
-        current = self.psu.get_current()
-        voltage = self.psu.get_voltage()
-
-        return voltage, current 
-    
-    def get_temp_data(self):
-        probe_temp_value = self.temp_probe.measure_temp()
-        print(f"Probe Temp Value: {probe_temp_value}")
-
-        probe_temp_value2 = self.temp_probe2.measure_temp()
-        print(f"Probe Temp Value 2: {probe_temp_value2}")
-
-        return probe_temp_value, probe_temp_value2
\ No newline at end of file
+        # Operator-driven recovery: always recall the state, even if it is the last one loaded
+        self.set_up_measurement(bandpath=bandpath, gain_setting=gain_setting, statefilepath=statefile_path, force_state=True)
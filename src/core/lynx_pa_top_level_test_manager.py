@@ -5,12 +5,83 @@ except Exception:  # Allow running in simulation without pyvisa installed
 from src.core.lynx_pa_top_level_test import BandwithPowerModuleTest, NetworkAnalyzerModuleTest
 from instruments.hardware_config import get_daq_instance
 from configs.scribe import Scribe
+from concurrent.futures import ThreadPoolExecutor
 import datetime as dt
 import logging
+from operator import itemgetter
+import queue
+import socket
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+
+def _is_visa_timeout(error):
+    """True for a pyvisa VI_ERROR_TMO; other failures (USB switch bank, serial DAQ) are not retried"""
+    return (pyvisa is not None and isinstance(error, pyvisa.errors.VisaIOError)
+            and error.error_code == pyvisa.constants.StatusCode.error_timeout)
+
+def _columns(*pairs):
+    """(header, bucket key) pairs -> (header names, itemgetter over the bucket keys)"""
+    return tuple(header for header, _ in pairs), itemgetter(*(key for _, key in pairs))
+
+# Sweep option sets shared by every path/run instead of rebuilt inline
+_ATTENUATION_SETTINGS = range(32)
+_GOLDEN_ATTENUATION_SETTINGS = (0, 18, 31)
+_HARMONIC_FREQUENCIES = frozenset((1.95E+9, 3E+9, 4E+9, 10E+9, 12.5E+9, 15E+9))
+
+# Result CSV columns for the sig-a buckets, in file order
+_POWER_METER_COLUMNS = _columns(
+    ("freq", "frequency_center"),
+    ("attenuation_setting", "gain_setting"),
+    ("waveform", "waveform"),
+    ("calibrated_power", "rfpm1_output_power_calibrated"),
+    ("uncalibrated_power", "rfpm1_output_power_uncalibrated"),
+    ("output_loss", "rfpm1_output_loss_@_freq"),
+    ("datetime", "datetime_string"),
+    ("temp_probe", "temp_probe1_value"),
+    ("temp_probe2", "temp_probe2_value"),
+    ("voltage", "voltage"),
+    ("current", "current"),
+    ("rf_on_off", "rf_on_off"),
+    ("fault_status", "fault_status"),
+    ("bandpath", "bandpath"),
+    ("gain_value", "gain_value"),
+    ("dut_temp_value", "temp_value"),
+)
+# NA S-parameter traces; the trace values follow
+_S_PARAM_COLUMNS = _columns(
+    ("attenuation_setting", "gain_setting"),
+    ("datetime_string", "datetime_string"),
+    ("temp_probe1_value", "temp_probe1_value"),
+    ("temp_probe2_value", "temp_probe2_value"),
+    ("voltage", "voltage"),
+    ("current", "current"),
+    ("rf_on_off", "rf_on_off"),
+    ("fault_status", "fault_status"),
+    ("bandpath", "bandpath"),
+    ("gain_value", "gain_value"),
+    ("dut_temp_value", "temp_value"),
+)
+# Standard bandwidth, harmonic and wideband traces; the trace frequencies/powers follow
+_SA_TRACE_COLUMNS = _columns(
+    ("freq", "frequency_center"),
+    ("attenuation_setting", "gain_setting"),
+    ("waveform", "waveform"),
+    ("bandwidth", "bandwidth"),
+    ("datetime_string", "datetime_string"),
+    ("temp_probe", "temp_probe1_value"),
+    ("temp_probe2", "temp_probe2_value"),
+    ("voltage", "voltage"),
+    ("current", "current"),
+    ("rf_on_off", "rf_on_off"),
+    ("fault_status", "fault_status"),
+    ("bandpath", "bandpath"),
+    ("gain_value", "gain_value"),
+    ("dut_temp_value", "temp_value"),
+)
+
 class PaTopLevelTestManager:
     
     def __init__(self, sim=True) -> None:
@@ -44,6 +115,14 @@ class PaTopLevelTestManager:
         self.telemetry_callback = None  # optional GUI callback
         self.external_telemetry_sink = None  # optional secondary sink (e.g., CSV proxy)
 
+        # TCPIP host name -> IP, resolved once (see _resolve_tcpip_resource)
+        self._dns_cache = {}
+
+        # Result CSV rows are written by a background thread (see _queue_write)
+        self._write_q = queue.Queue(maxsize=4096)
+        self._result_writer = None
+        self._write_error = None  # first exception raised on the writer thread
+
         # Common members
         self.running_state = False
         self.state = False
@@ -64,91 +143,45 @@ class PaTopLevelTestManager:
             if pyvisa is None:
                 raise RuntimeError("pyvisa is required for non-sim mode but is not installed")
             self.rm = pyvisa.ResourceManager()
-            self.instruments = self.rm.list_resources()
-            logger.info("Discovered VISA resources: %s", self.instruments)
-
-            try:
-                self.rfpm1 = E4418BPowerMeter("GPIB0::14::INSTR", name="rfpm1")
-                logger.info("POWER METER 1 OUTPUT CONNECTED")
-            except Exception:
-                self.rfpm1 = None
-                self.instruments_connection["rfpm1"] = False
-
-            try:
-                self.rfpm2 = E4418BPowerMeter("GPIB0::16::INSTR", name="rfpm2")
-                logger.info("POWER METER 2 INPUT CONNECTED")
-            except Exception:
-                self.rfpm2 = None
-                self.instruments_connection["rfpm2"] = False
-
-            try:
-                self.rfsg = E4438CSignalGenerator("GPIB0::30::INSTR")
-                logger.info("RFSG CONNECTED")
-            except Exception as e:
-                self.rfsg = None
-                self.instruments_connection["rfsg"] = False
-                logger.warning("RFSG NOT CONNECTED: %s", e, exc_info=True)
-
-            try:
-                self.rfsa = MXASignalAnalyzer("TCPIP0::K-N90X0A-000005.local::hislip0::INSTR")
-                logger.info("RFSA CONNECTED")
-            except Exception as e:
-                self.rfsa = None
-                self.instruments_connection["rfsa"] = False
-                logger.warning("RFSA NOT CONNECTED: %s", e, exc_info=True)
-
-            try:
-                self.na = PNAXNetworkAnalyzer("TCPIP0::K-Instr0000.local::hislip0::INSTR")
-                logger.info("NA CONNECTED")
-            except Exception:
-                self.na = None
-                self.instruments_connection["na"] = False
-                logger.warning("NA NOT connected")
-
-            try:
-                self.temp_probe = Agilent34401A("GPIB0::29::INSTR")
-                logger.info("TEMP PROBE 1 CONNECTED")
-            except Exception:
-                self.temp_probe = None
-                self.instruments_connection["temp_probe"] = False
-                logger.warning("Failed to connect to temp probe 1")
-
-            try:
-                self.temp_probe2 = Agilent34401A("GPIB0::22::INSTR")
-                logger.info("TEMP PROBE 2 CONNECTED")
-            except Exception:
-                self.temp_probe2 = None
-                self.instruments_connection["temp_probe2"] = False
-                logger.warning("Failed to connect to temp probe 2")
-
-            try:
-                self.power_supply = PowerSupply(visa_address="GPIB0::10::INSTR")
-                self.power_supply.set_voltage(28.0)
-                self.power_supply.set_current(2.5)
-                self.power_supply.set_output_state(True)
-                logger.info("Power Supply CONNECTED and configured")
-            except Exception:
-                self.power_supply = None
-                self.instruments_connection["power_supply"] = False
-                logger.warning("Power Supply NOT connected")
-
-            try:
-                self.switch_bank = ZtmModular()
-                self.switch_bank.init_resource("02402230028")
-                self.switch_bank.reset_all_switches()
-                logger.info("Switch bank CONNECTED")
-            except Exception as e:
-                self.switch_bank = None
-                self.instruments_connection["switch_bank"] = False
-                logger.warning("Failed to connect to switch bank: %s", e, exc_info=True)
-
-            try:
-                self.daq = get_daq_instance()
-                logger.info("DAQ connected successfully")
-            except Exception as e:
-                self.daq = None
-                self.instruments_connection["daq"] = False
-                logger.warning("FAILED TO CONNECT TO DAQ: %s", e)
+            # One bus scan up front; GPIB addresses missing from it are skipped
+            # instead of each waiting out a VISA open timeout.
+            self.instruments = frozenset(self.rm.list_resources())
+            logger.info("Discovered VISA resources: %s", sorted(self.instruments))
+
+            rm = self.rm
+
+            def _connect_power_supply(resource):
+                psu = PowerSupply(visa_address=resource, rm=rm)
+                psu.set_voltage(28.0)
+                psu.set_current(2.5)
+                psu.set_output_state(True)
+                return psu
+
+            def _connect_switch_bank(serial_number):
+                switch_bank = ZtmModular()
+                switch_bank.init_resource(serial_number)
+                switch_bank.reset_all_switches()
+                return switch_bank
+
+            # (attribute / instruments_connection key, log label, resource, connect(resource));
+            # VISA drivers open through the shared self.rm rather than each creating a ResourceManager
+            connections = (
+                ("rfpm1", "POWER METER 1 OUTPUT", "GPIB0::14::INSTR", lambda r: E4418BPowerMeter(r, name="rfpm1", rm=rm)),
+                ("rfpm2", "POWER METER 2 INPUT", "GPIB0::16::INSTR", lambda r: E4418BPowerMeter(r, name="rfpm2", rm=rm)),
+                ("rfsg", "RFSG", "GPIB0::30::INSTR", lambda r: E4438CSignalGenerator(r, rm=rm)),
+                ("rfsa", "RFSA", "TCPIP0::K-N90X0A-000005.local::hislip0::INSTR", lambda r: MXASignalAnalyzer(r, rm=rm)),
+                ("na", "NA", "TCPIP0::K-Instr0000.local::hislip0::INSTR", lambda r: PNAXNetworkAnalyzer(r, rm=rm)),
+                ("temp_probe", "TEMP PROBE 1", "GPIB0::29::INSTR", lambda r: Agilent34401A(r, rm=rm)),
+                ("temp_probe2", "TEMP PROBE 2", "GPIB0::22::INSTR", lambda r: Agilent34401A(r, rm=rm)),
+                ("power_supply", "POWER SUPPLY", "GPIB0::10::INSTR", _connect_power_supply),
+                ("switch_bank", "SWITCH BANK", "02402230028", _connect_switch_bank),
+                ("daq", "DAQ", None, lambda r: get_daq_instance()),
+            )
+            # Each open blocks on its own bus/session, so connect them all at once;
+            # startup then waits on the slowest instrument instead of the sum of all.
+            with ThreadPoolExecutor(max_workers=len(connections), thread_name_prefix="connect") as pool:
+                for key, label, resource, connect in connections:
+                    pool.submit(self._connect_instrument, key, label, connect, resource)
 
             from configs.configs import LynxPaConfig
             self.lynx_config = LynxPaConfig("LYNX_PA")
@@ -181,14 +214,14 @@ class PaTopLevelTestManager:
             self.freqs_and_switchpaths_siga_tests = {}
             self.freqs_and_switchpaths_na_tests = {}
 
-            self.paths = [
+            self.paths = (
                 "Band1_SN1",
                 "Band1_SN2",
                 "Band2_SN1",
                 "Band2_SN2",
                 "Band3_SN1",
                 "Band3_SN2",
-            ]
+            )
 
             self.scribe = Scribe("LYNX_PA")
             logger.info("Instrument connectivity summary: %s", self.instruments_connection)
@@ -223,7 +256,7 @@ class PaTopLevelTestManager:
             self.freqs_and_switchpaths_siga_tests = {}
             self.freqs_and_switchpaths_na_tests = {}
 
-            self.paths = [
+            self.paths = (
                 "HIGH_BAND_PATH1 (Vertical)",
                 "HIGH_BAND_PATH2 (Vertical)",
                 "HIGH_BAND_PATH3 (Vertical)",
@@ -236,14 +269,121 @@ class PaTopLevelTestManager:
                 "LOW_BAND_PATH1 (Horizontal)",
                 "LOW_BAND_PATH2 (Horizontal)",
                 "LOW_BAND_PATH3 (Horizontal)",
-            ]
+            )
 
             self.scribe = Scribe("LYNX_PA")
             logger.info(
                 "Simulation mode initialized - DAQ available: %s", hasattr(self, 'daq') and self.daq is not None
             )
 
+        # Path name -> position in self.paths
+        self._path_index = {name: i for i, name in enumerate(self.paths)}
+
+    def _connect_instrument(self, key, label, connect, resource=None) -> None:
+        """Connect one instrument via ``connect(resource)`` and record the result under `key`.
+
+        The instrument (or None on failure) is stored as ``self.<key>`` and
+        ``instruments_connection[key]`` is cleared when the connection fails.
+        GPIB resources absent from the startup scan are failed without opening,
+        and an open that fails with a VISA timeout is retried once.
+        """
+        if resource is not None and resource.startswith("GPIB") and resource not in self.instruments:
+            setattr(self, key, None)
+            self.instruments_connection[key] = False
+            logger.warning("%s NOT CONNECTED: %s not found on the bus", label, resource)
+            return
+        if resource is not None and resource.startswith("TCPIP"):
+            try:
+                resource = self._resolve_tcpip_resource(resource)
+            except OSError as e:
+                setattr(self, key, None)
+                self.instruments_connection[key] = False
+                logger.warning("%s NOT CONNECTED: cannot resolve %s: %s", label, resource, e)
+                return
+        for attempt in (1, 2):
+            try:
+                setattr(self, key, connect(resource))
+                logger.info("%s CONNECTED", label)
+                return
+            except Exception as e:
+                if attempt == 1 and _is_visa_timeout(e):
+                    # A timed-out open is often a slow first handshake; one quick retry
+                    logger.info("%s open timed out, retrying once", label)
+                    continue
+                setattr(self, key, None)
+                self.instruments_connection[key] = False
+                logger.warning("%s NOT CONNECTED: %s", label, e, exc_info=True)
+                return
+
+    def _resolve_tcpip_resource(self, resource):
+        """Return resource with its host name (e.g. an mDNS .local name) replaced by the resolved IPv4 address.
+
+        Lookups are cached in self._dns_cache; raises OSError if the host does not resolve.
+        """
+        parts = resource.split("::")
+        host = parts[1]
+        ip = self._dns_cache.get(host)
+        if ip is None:
+            ip = self._dns_cache[host] = socket.gethostbyname(host)
+            logger.info("Resolved %s -> %s", host, ip)
+        parts[1] = ip
+        return "::".join(parts)
+
+    # --- Result writing ---
+
+    def _queue_write(self, write, *args, **kwargs) -> None:
+        """Hand a Scribe write call to the result writer thread so disk I/O stays off the test loop.
+
+        Raises the first error from an earlier failed write so the run stops instead of dropping rows.
+        """
+        self._raise_write_error()
+        if self._result_writer is None:
+            self._result_writer = threading.Thread(target=self._result_writer_loop, name="result-writer", daemon=True)
+            self._result_writer.start()
+        elif not self._result_writer.is_alive():
+            raise RuntimeError("Result writer thread has stopped; queued result rows were not written")
+        self._write_q.put((write, args, kwargs))
+
+    def _result_writer_loop(self) -> None:
+        while True:
+            write, args, kwargs = self._write_q.get()
+            try:
+                write(*args, **kwargs)
+            except Exception as e:
+                logger.error("Result write failed: %s", getattr(write, "__name__", write), exc_info=True)
+                if self._write_error is None:
+                    self._write_error = e
+            finally:
+                self._write_q.task_done()
+
+    def _raise_write_error(self) -> None:
+        """Re-raise (once) the first exception recorded by the result writer thread."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def flush_results(self) -> None:
+        """Block until every queued result row has been written; raises the first failed write, if any."""
+        writer = self._result_writer
+        if writer is not None and not writer.is_alive() and not self._write_q.empty():
+            raise RuntimeError("Result writer thread has stopped; queued result rows were not written")
+        self._write_q.join()
+        self._raise_write_error()
+
+    def _close_results_after_error(self) -> None:
+        """Flush rows measured before a failed run and close the result files.
+
+        A write error found here is logged rather than raised so it does not replace the test error in flight.
+        """
+        try:
+            self.flush_results()
+        except Exception:
+            logger.error("Result write failed during an aborted run", exc_info=True)
+        finally:
+            self.scribe.close_files()
+
     # --- GUI/telemetry wiring ---
+
     def set_telemetry_callback(self, callback):
         """Register a GUI telemetry callback compatible with live_view."""
         self.telemetry_callback = callback
@@ -437,439 +577,281 @@ class PaTopLevelTestManager:
             "dut_temp_value"
             ] + freqs
 
-        self.scribe.write_na_module_data(switchpath, ratioed_power, "MLOG", headers)
-        self.scribe.write_na_module_data(switchpath, ratioed_power, "PHASE", headers)
-
-        for gain_data in gain_bucket:
-            freqs = gain_data["freqs"]
-            gain = gain_data["gain"]
-            gain_setting = gain_data["gain_setting"]
-            datetime_string = gain_data["datetime_string"]
-            temp_probe = gain_data["temp_probe1_value"]
-            temp_probe2 = gain_data["temp_probe2_value"]
-            voltage = gain_data["voltage"]
-            current = gain_data["current"]
-            ratioed_power = gain_data["ratioed_power"]
-            rf_on_off = gain_data["rf_on_off"]
-            fault_status = gain_data["fault_status"]
-            bandpath = gain_data["bandpath"]
-            gain_value = gain_data["gain_value"]
-            dut_temp_value = gain_data["temp_value"]
-            
-            frame = [
-                gain_setting,
-                datetime_string,
-                temp_probe,
-                temp_probe2,
-                voltage,
-                current,
-                rf_on_off,
-                fault_status,
-                bandpath,
-                gain_value,
-                dut_temp_value
-                ] + gain
-
-            self.scribe.write_na_module_data(switchpath, ratioed_power, "MLOG", frame)
-
-        for phase_data in phase_bucket:
-            freqs = phase_data["freqs"]
-            phase = phase_data["phase"]
-            gain_setting = phase_data["gain_setting"]
-            datetime_string = phase_data["datetime_string"]
-            temp_probe = phase_data["temp_probe1_value"]
-            temp_probe2 = phase_data["temp_probe2_value"]
-            voltage = phase_data["voltage"]
-            current = phase_data["current"]
-            ratioed_power = phase_data["ratioed_power"]
-            rf_on_off = phase_data["rf_on_off"] 
-            fault_status = phase_data["fault_status"]
-            bandpath = phase_data["bandpath"]
-            gain_value = phase_data["gain_value"]
-            dut_temp_value = phase_data["temp_value"]
-
-            frame = [
-                gain_setting,
-                datetime_string,
-                temp_probe,
-                temp_probe2,
-                voltage,
-                current,
-                rf_on_off,
-                fault_status,
-                bandpath,
-                gain_value,
-                dut_temp_value
-            ] + phase
-
-            self.scribe.write_na_module_data(switchpath, ratioed_power, "PHASE", frame)
-    
-    def process_and_write_module_power_meter_tests(self, power_meter_bucket, results_filepath):
-        freq = power_meter_bucket["frequency_center"]
-        calibrated_power = power_meter_bucket["rfpm1_output_power_calibrated"]
-        uncalibrated_power = power_meter_bucket["rfpm1_output_power_uncalibrated"]
-        output_loss = power_meter_bucket["rfpm1_output_loss_@_freq"]
-        waveform = power_meter_bucket["waveform"]
-        datetime_string = power_meter_bucket["datetime_string"]
-        temp_probe = power_meter_bucket["temp_probe1_value"]
-        temp_probe2 = power_meter_bucket["temp_probe2_value"]
-        voltage = power_meter_bucket["voltage"]
-        current = power_meter_bucket["current"]
-        gain_setting = power_meter_bucket["gain_setting"]
-        rf_on_off = power_meter_bucket["rf_on_off"]
-        fault_status = power_meter_bucket["fault_status"]
-        bandpath = power_meter_bucket["bandpath"]
-        gain_value = power_meter_bucket["gain_value"]
-        dut_temp_value = power_meter_bucket["temp_value"]
-
-        headers = [
-            "freq",
-            "attenuation_setting",
-            "waveform",
-            "calibrated_power",
-            "uncalibrated_power",
-            "output_loss",
-            "datetime",
-            "temp_probe",
-            "temp_probe2",
+        # Bucket keys for the scalar columns, in header order; the trace values follow
+        fields = (
+            "gain_setting",
+            "datetime_string",
+            "temp_probe1_value",
+            "temp_probe2_value",
             "voltage",
             "current",
             "rf_on_off",
             "fault_status",
             "bandpath",
             "gain_value",
-            "dut_temp_value"
-        ]
+            "temp_value"
+            )
 
-        self.scribe.write_data_from_filepath(results_filepath, headers)
-
-        frame = [
-            freq,
-            gain_setting,
-            waveform,
-            calibrated_power,
-            uncalibrated_power,
-            output_loss,
-            datetime_string,
-            temp_probe,
-            temp_probe2,
-            voltage,
-            current,
-            rf_on_off,
-            fault_status,
-            bandpath,
-            gain_value,
-            dut_temp_value
-        ]
-        self.scribe.write_data_from_filepath(results_filepath, frame)
+        gain_rows = [headers]
+        gain_rows += [[gain_data[key] for key in fields] + gain_data["gain"] for gain_data in gain_bucket]
+        phase_rows = [headers]
+        phase_rows += [[phase_data[key] for key in fields] + phase_data["phase"] for phase_data in phase_bucket]
+
+        self._queue_write(self.scribe.write_na_module_rows, switchpath, ratioed_power, "MLOG", gain_rows)
+        self._queue_write(self.scribe.write_na_module_rows, switchpath, ratioed_power, "PHASE", phase_rows)
+    
+    def _write_frame(self, bucket, filepath, columns, trace_keys=None):
+        """Queue a header row and a data row for bucket; trace_keys=(x key, y key) appends a trace to both."""
+        headers, frame = columns
+        headers = list(headers)
+        frame = list(frame(bucket))
+        if trace_keys is not None:
+            x_key, y_key = trace_keys
+            headers.extend(bucket[x_key])
+            frame.extend(bucket[y_key])
+
+        self._queue_write(self.scribe.write_rows_from_filepath, filepath, (headers, frame))
 
+    def process_and_write_module_power_meter_tests(self, power_meter_bucket, results_filepath):
+        self._write_frame(power_meter_bucket, results_filepath, _POWER_METER_COLUMNS)
 
     def process_and_write_module_standard_bandwidth_tests(self, standard_bucket, results_filepath):
-        freq = standard_bucket["frequency_center"]
-        freqs = standard_bucket["freqs"]
-        powers = standard_bucket["powers"]
-        bandwidth = standard_bucket["bandwidth"]
-        gain_setting = standard_bucket["gain_setting"]
-        waveform = standard_bucket["waveform"]
-        datetime_string = standard_bucket["datetime_string"]
-        temp_probe = standard_bucket["temp_probe1_value"]
-        temp_probe2 = standard_bucket["temp_probe2_value"]
-        voltage = standard_bucket["voltage"]
-        current = standard_bucket["current"]
-        rf_on_off = standard_bucket["rf_on_off"]
-        fault_status = standard_bucket["fault_status"]  
-        bandpath = standard_bucket["bandpath"]
-        gain_value = standard_bucket["gain_value"]
-        dut_temp_value = standard_bucket["temp_value"]
-
-        headers_frame = [
-        "freq",
-        "attenuation_setting",
-        "waveform",
-        "bandwidth",
-        "datetime_string",
-        "temp_probe",
-        "temp_probe2",
-        "voltage",
-        "current", 
-        "rf_on_off",
-        "fault_status",
-        "bandpath",
-        "gain_value",
-        "dut_temp_value"
-        ] + freqs
-
-        frame = [
-            freq,
-            gain_setting,
-            waveform,
-            bandwidth,
-            datetime_string,
-            temp_probe,
-            temp_probe2,
-            voltage,
-            current,
-            rf_on_off,
-            fault_status,
-            bandpath,
-            gain_value,
-            dut_temp_value
-            ] + powers
-        
-        self.scribe.write_data_from_filepath(results_filepath, headers_frame)
-        self.scribe.write_data_from_filepath(results_filepath, frame)
+        self._write_frame(standard_bucket, results_filepath, _SA_TRACE_COLUMNS, trace_keys=("freqs", "powers"))
 
     def process_and_write_module_harmonic_tests(self, harmonic_bucket, results_filepath):
-        freq = harmonic_bucket["frequency_center"]
-        freqs = harmonic_bucket["freqs"]
-        gain_setting = harmonic_bucket["gain_setting"]
-        powers = harmonic_bucket["powers"]
-        bandwidth = harmonic_bucket["bandwidth"]
-        waveform = harmonic_bucket["waveform"]
-        datetime_string = harmonic_bucket["datetime_string"]
-        temp_probe = harmonic_bucket["temp_probe1_value"]
-        temp_probe2 = harmonic_bucket["temp_probe2_value"]
-        voltage = harmonic_bucket["voltage"]
-        current = harmonic_bucket["current"]
-        rf_on_off = harmonic_bucket["rf_on_off"]
-        fault_status = harmonic_bucket["fault_status"]
-        bandpath = harmonic_bucket["bandpath"]
-        gain_value = harmonic_bucket["gain_value"]
-        dut_temp_value = harmonic_bucket["temp_value"]
-
-        headers_frame = [
-        "freq",
-        "attenuation_setting",
-        "waveform",
-        "bandwidth",
-        "datetime_string",
-        "temp_probe",
-        "temp_probe2",
-        "voltage",
-        "current",
-        "rf_on_off",
-        "fault_status",
-        "bandpath",
-        "gain_value",
-        "dut_temp_value"
-        ] + freqs
-        frame = [
-                freq,
-                gain_setting,
-                waveform,
-                bandwidth,
-                datetime_string,
-                temp_probe,
-                temp_probe2,
-                voltage,
-                current,
-                rf_on_off,
-                fault_status,
-                bandpath,
-                gain_value,
-                dut_temp_value
-                ] + powers
-        
-        self.scribe.write_data_from_filepath(results_filepath, headers_frame)
-        self.scribe.write_data_from_filepath(results_filepath, frame)
+        self._write_frame(harmonic_bucket, results_filepath, _SA_TRACE_COLUMNS, trace_keys=("freqs", "powers"))
 
-    def process_and_write_module_S_param(self, bucket, filepath, headers=False):
-        freqs = bucket["freqs"]
-        try:
-            trace_data = bucket["gain"]
-        except:
-            trace_data = bucket["phase"]
-
-        gain_setting = bucket["gain_setting"]
-        datetime_string = bucket["datetime_string"]
-        temp_probe = bucket["temp_probe1_value"]
-        temp_probe2 = bucket["temp_probe2_value"]
-        voltage = bucket["voltage"]
-        current = bucket["current"]
-        rf_on_off = bucket["rf_on_off"]
-        fault_status = bucket["fault_status"]
-        bandpath = bucket["bandpath"]
-        gain_value = bucket["gain_value"]
-        dut_temp_value = bucket["temp_value"]
+    def process_and_write_module_S_param(self, bucket, filepath, headers=False, kind="gain"):
+        """Queue one NA trace row; kind is the bucket key holding the trace (the NA buckets use "gain" for MLOG and PHASE)."""
+        header_names, frame = _S_PARAM_COLUMNS
+        frame = list(frame(bucket))
+        frame.extend(bucket[kind])
 
         if headers:
-            headers = [
-                "attenuation_setting",
-                "datetime_string",
-                "temp_probe1_value",
-                "temp_probe2_value",
-                "voltage",
-                "current",
-                "rf_on_off",
-                "fault_status",
-                "bandpath",
-                "gain_value",
-                "dut_temp_value"
-            ] + freqs
-
-            self.scribe.write_data_from_filepath(filepath=filepath, data=headers)
-
-        frame = [
-        gain_setting,
-        datetime_string,
-        temp_probe,
-        temp_probe2,
-        voltage,
-        current,
-        rf_on_off,
-        fault_status,
-        bandpath,
-        gain_value,
-        dut_temp_value
-        ] + trace_data
-
-        self.scribe.write_data_from_filepath(filepath=filepath, data=frame)
-        
+            rows = (list(header_names) + bucket["freqs"], frame)
+        else:
+            rows = (frame,)
+        self._queue_write(self.scribe.write_rows_from_filepath, filepath, rows)
 
     def clean_up(self):
-        logger.info("Cleanup: disabling RF, stopping RFSG, resetting switches")
-        try:
-            if getattr(self, "daq", None) is not None:
-                self.daq.set_band("NONE")
-                self.daq.disable_rf()
-        except Exception:
-            pass
-        try:
-            if getattr(self, "rfsg", None) is not None:
-                self.rfsg.stop()
-        except Exception:
-            pass
         try:
-            if getattr(self, "switch_bank", None) is not None:
-                self.switch_bank.reset_all_switches()
-        except Exception:
-            pass
+            self.flush_results()
+        finally:
+            # A failed result write must not leave RF enabled
+            self.scribe.close_files()
+            logger.info("Cleanup: disabling RF, stopping RFSG, resetting switches")
+            try:
+                if getattr(self, "daq", None) is not None:
+                    self.daq.set_band("NONE")
+                    self.daq.disable_rf()
+            except Exception:
+                pass
+            try:
+                if getattr(self, "rfsg", None) is not None:
+                    self.rfsg.stop()
+            except Exception:
+                pass
+            try:
+                if getattr(self, "switch_bank", None) is not None:
+                    self.switch_bank.reset_all_switches()
+            except Exception:
+                pass
 
     def run_state_process(self, path, gain_setting, measurement_type, options={}):
         logger.info("run_state_process | path=%s | gain=%s | type=%s | options=%s", path, gain_setting, measurement_type, options)
-        switchpath = self.lynx_config.paths[path][measurement_type]["switchpath"]
+        measurement = self.lynx_config.paths[path][measurement_type]
+        switchpath = measurement["switchpath"]
         if measurement_type == "Signal Analyzer Bandwidth":
             bandwidth = options["bandwidth"]
             if bandwidth == "harmonic":
-                bandwidth = self.lynx_config.paths[path][measurement_type]["harmonic_start_stop"]
+                bandwidth = measurement["harmonic_start_stop"]
             elif bandwidth == "wideband":
-                bandwidth = self.lynx_config.paths[path][measurement_type]["wideband_start_stop"]
+                bandwidth = measurement["wideband_start_stop"]
             else:
                 bandwidth = float(bandwidth) * 1e+6
 
             frequency = options["frequency"]
             waveform = options["waveform"]
             input_loss = self.lynx_config.get_input_loss_by_path_and_freq(path=path, freq=frequency)
-            self.sig_a_test.recover_test_state(switchpath=switchpath, bandwidth=bandwidth, frequency=frequency, gain_setting=gain_setting,waveform=waveform, input_loss=input_loss)
+            bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
+            self.sig_a_test.recover_test_state(bandpath=bandpath, switchpath=switchpath, bandwidth=bandwidth, frequency=frequency, gain_setting=gain_setting,waveform=waveform, input_loss=input_loss)
         else:
-            statefile_path = self.lynx_config.paths[path][measurement_type]["state_filepath"]
+            statefile_path = measurement["state_filepath"]
             bandpath = self.na_test.config.get_bandpath_by_path(path)
             self.na_test.recover_test_state(bandpath=bandpath, switchpath=switchpath, gain_setting=gain_setting, statefile_path=statefile_path)
 
-    def run_and_process_tests(self, path, sno, sig_a_tests=False, na_tests=True, golden_tests=False, options={}):
-        logger.info("TestManager start | path=%s |  flags={sig_a=%s, na=%s, golden=%s}", path, sig_a_tests, na_tests, golden_tests)
-        # initial snapshot to GUI
-        self._emit_periodic_snapshot(phase="tests-start")
-        if sig_a_tests:
-            # Run SIG A tests
-            logger.info("SIG_A tests: starting")
-            switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
-            freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
-            attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
-            bandwidths = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["bandwidths"]
-            waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
-            harmonic_start_stop = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["harmonic_start_stop"]
-            wideband_start_stop = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["wideband_start_stop"]
-            harmonic_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["harmonic_results_filepath"]
-            standard_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["standard_results_filepath"]
-            power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
-            wideband_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["wideband_results_filepath"]
+    def resolve_path(self, path):
+        """Return the path name for a position in self.paths or a path name; raises KeyError if unknown."""
+        if isinstance(path, int):
+            return self.paths[path]
+        if path not in self._path_index:
+            raise KeyError(path)
+        return path
 
-            self.switch_bank.set_all_switches(switchpath)
+    def run_and_process_tests(self, path, sno, sig_a_tests=False, na_tests=True, golden_tests=False, options={}):
+        try:
+            path = self.resolve_path(path)
+            logger.info("TestManager start | path=%s |  flags={sig_a=%s, na=%s, golden=%s}", path, sig_a_tests, na_tests, golden_tests)
+            # initial snapshot to GUI
+            self._emit_periodic_snapshot(phase="tests-start")
+            path_config = self.lynx_config.paths[path]
+            if sig_a_tests:
+                # Run SIG A tests
+                logger.info("SIG_A tests: starting")
+                sab = path_config["Signal Analyzer Bandwidth"]
+                switchpath = sab["switchpath"]
+                freqs = sab["freqs"]
+                attenuation_settings = sab["attenuation_settings"]
+                bandwidths = sab["bandwidths"]
+                waveforms = sab["waveforms"]
+                harmonic_start_stop = sab["harmonic_start_stop"]
+                wideband_start_stop = sab["wideband_start_stop"]
+                harmonic_results_filepath = sab["harmonic_results_filepath"]
+                standard_results_filepath = sab["standard_results_filepath"]
+                power_meter_filepath = sab["power_meter_filepath"]
+                wideband_results_filepath = sab["wideband_results_filepath"]
+
+                self.switch_bank.set_all_switches(switchpath)
 
-            for frequency in freqs:
-                self._emit_periodic_snapshot(phase="sig_a-setup")
-                output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
-                input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
                 bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
-                rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
+                for frequency in freqs:
+                    self._emit_periodic_snapshot(phase="sig_a-setup")
+                    output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
+                    input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
+                    rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
+
+                    self._emit_periodic_snapshot(phase="sig_a-running")
+
+                    if golden_tests:
+                        for attenuation_setting in attenuation_settings:
+                            for waveform in waveforms:
+                                golden_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
+                                    bandpath=bandpath,
+                                    frequency=frequency,
+                                    waveform=waveform,
+                                    gain_setting=attenuation_setting,
+                                    output_loss=output_loss
+                                )
+                                self.process_and_write_module_power_meter_tests(golden_bucket, power_meter_filepath)
+                                self._emit_periodic_snapshot(phase="sig_a-power-meter")
+                    else:
+                        for attenuation_setting in attenuation_settings:
+                            for bandwidth in bandwidths:
+                                waveform = "OQPSK"
+                                standard_bucket = self.sig_a_test.get_standard_bandwidth_by_frequency(
+                                    bandpath=bandpath,
+                                    frequency=frequency,
+                                    bandwidth=bandwidth,
+                                    gain_setting=attenuation_setting,
+                                    waveform=waveform
+                                )
 
-                self.rfsg.set_frequency(frequency=frequency)
-                self.rfsg.set_amplitude(rfsg_input_power)
-                self._emit_periodic_snapshot(phase="sig_a-running")
+                                self.process_and_write_module_standard_bandwidth_tests(standard_bucket, standard_results_filepath)
+                                self._emit_periodic_snapshot(phase="sig_a-standard")
 
-                if golden_tests:
-                    for attenuation_setting in attenuation_settings:
-                        for waveform in waveforms:
-                            golden_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
-                                bandpath=bandpath,
-                                frequency=frequency,
-                                waveform=waveform,
-                                gain_setting=attenuation_setting,
-                                output_loss=output_loss
-                            )
-                            self.process_and_write_module_power_meter_tests(golden_bucket, power_meter_filepath)
-                            self._emit_periodic_snapshot(phase="sig_a-power-meter")
-                else:
-                    for attenuation_setting in attenuation_settings:
-                        for bandwidth in bandwidths:
-                            waveform = "OQPSK"
-                            standard_bucket = self.sig_a_test.get_standard_bandwidth_by_frequency(
-                                bandpath=bandpath,
-                                frequency=frequency,
-                                bandwidth=bandwidth,
-                                gain_setting=attenuation_setting,
-                                waveform=waveform
-                            )
+                            for waveform in waveforms:
 
-                            self.process_and_write_module_standard_bandwidth_tests(standard_bucket, standard_results_filepath)
-                            self._emit_periodic_snapshot(phase="sig_a-standard")
+                                if frequency in _HARMONIC_FREQUENCIES:
+                                    harmonic_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                                        bandpath=bandpath,
+                                        frequency=frequency,
+                                        harmonic_start_stop=harmonic_start_stop,
+                                        waveform=waveform,
+                                        gain_setting=attenuation_setting,
+                                    )
+                                    self.process_and_write_module_harmonic_tests(harmonic_bucket, harmonic_results_filepath)
+                                    self._emit_periodic_snapshot(phase="sig_a-harmonic")
 
-                        for waveform in waveforms:
+                                wideband_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                                    bandpath=bandpath,
+                                    frequency=frequency,
+                                    harmonic_start_stop=wideband_start_stop,
+                                    waveform=waveform,
+                                    gain_setting=attenuation_setting
+                                )
+                                self.process_and_write_module_harmonic_tests(wideband_bucket, wideband_results_filepath)
+                                self._emit_periodic_snapshot(phase="sig_a-wideband")
 
-                            if frequency in [1.95E+9, 3E+9, 4E+9, 10E+9, 12.5E+9, 15E+9]:
-                                harmonic_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                                power_meter_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
                                     bandpath=bandpath,
                                     frequency=frequency,
-                                    harmonic_start_stop=harmonic_start_stop,
                                     waveform=waveform,
                                     gain_setting=attenuation_setting,
+                                    output_loss=output_loss,
                                 )
-                                self.process_and_write_module_harmonic_tests(harmonic_bucket, harmonic_results_filepath)
-                                self._emit_periodic_snapshot(phase="sig_a-harmonic")
+                                self.process_and_write_module_power_meter_tests(power_meter_bucket, power_meter_filepath)
+                                self._emit_periodic_snapshot(phase="sig_a-power-meter")
 
-                            wideband_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
-                                bandpath=bandpath,
-                                frequency=frequency,
-                                harmonic_start_stop=wideband_start_stop,
-                                waveform=waveform,
-                                gain_setting=attenuation_setting
-                            )
-                            self.process_and_write_module_harmonic_tests(wideband_bucket, wideband_results_filepath)
-                            self._emit_periodic_snapshot(phase="sig_a-wideband")
+                        self.rfsg.stop()
+                        noise_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                            bandpath=bandpath,
+                            frequency=frequency,
+                            harmonic_start_stop=wideband_start_stop,
+                            waveform="CW",
+                            gain_setting=attenuation_setting,
+                        )
+                        self.process_and_write_module_harmonic_tests(noise_bucket, wideband_results_filepath)
+                        self._emit_periodic_snapshot(phase="sig_a-noise")
+
+            if na_tests:
+                # 31 Steps of attenuation
+                logger.info("NA tests: starting")
+                s21 = path_config["S21"]
+                s21_gain_results_filepath = s21["gain_results_filepath"]
+                s21_phase_results_filepath = s21["phase_results_filepath"]
+                s21_statefilepath = s21["state_filepath"]
+                s21_switchpath = s21["switchpath"]
 
-                            power_meter_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
-                                bandpath=bandpath,
-                                frequency=frequency,
-                                waveform=waveform,
-                                gain_setting=attenuation_setting,
-                                output_loss=output_loss,
-                            )
-                            self.process_and_write_module_power_meter_tests(power_meter_bucket, power_meter_filepath)
-                            self._emit_periodic_snapshot(phase="sig_a-power-meter")
+                if golden_tests:
+                    attenuation_settings = _GOLDEN_ATTENUATION_SETTINGS
+                else:
+                    attenuation_settings = _ATTENUATION_SETTINGS
+
+                self.switch_bank.set_all_switches(s21_switchpath)
+                bandpath = self.lynx_config.get_bandpath_by_path(path)
+                for attenuation_setting in attenuation_settings:
+                    self._emit_periodic_snapshot(phase="na-setup")
+
+                    # One DAQ settle per attenuation; MLOG and PHASE come from the same sweep. The
+                    # state is recalled on the first step and reused for the rest of this sweep
+                    gain, phase = self.na_test.get_ratioed_power_measurements(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S21", formats=("MLOG", "PHASE"), statefilepath=s21_statefilepath, force_state=attenuation_setting == attenuation_settings[0])
+
+                    if attenuation_setting == 0:
+                        headers = True
+                    else:
+                        headers = False
+
+                    self.process_and_write_module_S_param(filepath=s21_gain_results_filepath, bucket=gain, headers=headers)
+                    self.process_and_write_module_S_param(filepath=s21_phase_results_filepath, bucket=phase, headers=headers)
+                    self._emit_periodic_snapshot(phase="na-s21")
+
+                s11 = path_config["S11"]
+                s11_state_filepath = s11["state_filepath"]
+                s11_results_filepath = s11["results_filepath"]
+                s11_switchpath = s11["switchpath"]
+                self.switch_bank.set_all_switches(s11_switchpath)
+                gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S11", format="MLOG", statefilepath=s11_state_filepath, force_state=True)
+                self.process_and_write_module_S_param(filepath=s11_results_filepath, bucket=gain, headers=True)
+                self._emit_periodic_snapshot(phase="na-s11")
+
+                s22 = path_config["S22"]
+                s22_state_filepath = s22["state_filepath"]
+                s22_results_filepath = s22["results_filepath"]
+                s22_switchpath = s22["switchpath"]
+                self.switch_bank.set_all_switches(s22_switchpath)
+                gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S22", format="MLOG", statefilepath=s22_state_filepath, force_state=True)
+                self.process_and_write_module_S_param(filepath=s22_results_filepath, bucket=gain, headers=True)
+                self._emit_periodic_snapshot(phase="na-s22")
+
+            logger.info("TestManager end | path=%s", path)
+            self._emit_periodic_snapshot(phase="tests-end")
+            self.clean_up()
+        except BaseException:
+            self._close_results_after_error()
+            raise
 
-                    self.rfsg.stop()
-                    noise_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
-                        bandpath=bandpath,
-                        frequency=frequency,
-                        harmonic_start_stop=wideband_start_stop,
-                        waveform="CW",
-                        gain_setting=attenuation_setting,
-                    )
-                    self.process_and_write_module_harmonic_tests(noise_bucket, wideband_results_filepath)
-                    self._emit_periodic_snapshot(phase="sig_a-noise")
-
-        if na_tests:
+    def _run_na_performance_tests(self, path):
+        try:
             # 31 Steps of attenuation
             logger.info("NA tests: starting")
             s21_gain_results_filepath = self.lynx_config.paths[path]["S21"]["gain_results_filepath"]
@@ -877,18 +859,16 @@ class PaTopLevelTestManager:
             s21_statefilepath = self.lynx_config.paths[path]["S21"]["state_filepath"]
             s21_switchpath = self.lynx_config.paths[path]["S21"]["switchpath"]
 
-            if golden_tests:
-                attenuation_settings = [0, 18, 31]
-            else:
-                attenuation_settings = range(0, 32, 1)
+            attenuation_settings = _ATTENUATION_SETTINGS
 
             self.switch_bank.set_all_switches(s21_switchpath)
             bandpath = self.lynx_config.get_bandpath_by_path(path)
             for attenuation_setting in attenuation_settings:
                 self._emit_periodic_snapshot(phase="na-setup")
 
-                gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S21", format="MLOG", statefilepath=s21_statefilepath)
-                phase = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S21", format="PHASE", statefilepath=s21_statefilepath)
+                # One DAQ settle per attenuation; MLOG and PHASE come from the same sweep. The
+                # state is recalled on the first step and reused for the rest of this sweep
+                gain, phase = self.na_test.get_ratioed_power_measurements(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S21", formats=("MLOG", "PHASE"), statefilepath=s21_statefilepath, force_state=attenuation_setting == attenuation_settings[0])
 
                 if attenuation_setting == 0:
                     headers = True
@@ -903,7 +883,7 @@ class PaTopLevelTestManager:
             s11_results_filepath = self.lynx_config.paths[path]["S11"]["results_filepath"]
             s11_switchpath = self.lynx_config.paths[path]["S11"]["switchpath"]
             self.switch_bank.set_all_switches(s11_switchpath)
-            gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S11", format="MLOG", statefilepath=s11_state_filepath)
+            gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S11", format="MLOG", statefilepath=s11_state_filepath, force_state=True)
             self.process_and_write_module_S_param(filepath=s11_results_filepath, bucket=gain, headers=True)
             self._emit_periodic_snapshot(phase="na-s11")
 
@@ -911,225 +891,187 @@ class PaTopLevelTestManager:
             s22_results_filepath = self.lynx_config.paths[path]["S22"]["results_filepath"]
             s22_switchpath = self.lynx_config.paths[path]["S22"]["switchpath"]
             self.switch_bank.set_all_switches(s22_switchpath)
-            gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S22", format="MLOG", statefilepath=s22_state_filepath)
+            gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S22", format="MLOG", statefilepath=s22_state_filepath, force_state=True)
             self.process_and_write_module_S_param(filepath=s22_results_filepath, bucket=gain, headers=True)
             self._emit_periodic_snapshot(phase="na-s22")
 
-        logger.info("TestManager end | path=%s", path)
-        self._emit_periodic_snapshot(phase="tests-end")
-        self.clean_up()
+            self.clean_up()
+        except BaseException:
+            self._close_results_after_error()
+            raise
 
-    def _run_na_performance_tests(self, path):
-        # 31 Steps of attenuation
-        logger.info("NA tests: starting")
-        s21_gain_results_filepath = self.lynx_config.paths[path]["S21"]["gain_results_filepath"]
-        s21_phase_results_filepath = self.lynx_config.paths[path]["S21"]["phase_results_filepath"]
-        s21_statefilepath = self.lynx_config.paths[path]["S21"]["state_filepath"]
-        s21_switchpath = self.lynx_config.paths[path]["S21"]["switchpath"]
+    def _run_sig_a_performance_tests(self, path):
+        try:
+            # initial snapshot to GUI
+            self._emit_periodic_snapshot(phase="tests-start")
 
-        attenuation_settings = range(0, 32, 1)
+            logger.info("SIG_A tests: starting")
+            switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
+            freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
+            attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
+            bandwidths = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["bandwidths"]
+            waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
+            harmonic_start_stop = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["harmonic_start_stop"]
+            wideband_start_stop = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["wideband_start_stop"]
+            harmonic_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["harmonic_results_filepath"]
+            standard_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["standard_results_filepath"]
+            power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
+            wideband_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["wideband_results_filepath"]
 
-        self.switch_bank.set_all_switches(s21_switchpath)
-        bandpath = self.lynx_config.get_bandpath_by_path(path)
-        for attenuation_setting in attenuation_settings:
-            self._emit_periodic_snapshot(phase="na-setup")
+            self.switch_bank.set_all_switches(switchpath)
 
-            gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S21", format="MLOG", statefilepath=s21_statefilepath)
-            phase = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S21", format="PHASE", statefilepath=s21_statefilepath)
+            bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
+            for frequency in freqs:
+                self._emit_periodic_snapshot(phase="sig_a-setup")
+                output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
+                input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
+                rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
 
-            if attenuation_setting == 0:
-                headers = True
-            else:
-                headers = False
-
-            self.process_and_write_module_S_param(filepath=s21_gain_results_filepath, bucket=gain, headers=headers)
-            self.process_and_write_module_S_param(filepath=s21_phase_results_filepath, bucket=phase, headers=headers)
-            self._emit_periodic_snapshot(phase="na-s21")
-
-        s11_state_filepath = self.lynx_config.paths[path]["S11"]["state_filepath"]
-        s11_results_filepath = self.lynx_config.paths[path]["S11"]["results_filepath"]
-        s11_switchpath = self.lynx_config.paths[path]["S11"]["switchpath"]
-        self.switch_bank.set_all_switches(s11_switchpath)
-        gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S11", format="MLOG", statefilepath=s11_state_filepath)
-        self.process_and_write_module_S_param(filepath=s11_results_filepath, bucket=gain, headers=True)
-        self._emit_periodic_snapshot(phase="na-s11")
-
-        s22_state_filepath = self.lynx_config.paths[path]["S22"]["state_filepath"]
-        s22_results_filepath = self.lynx_config.paths[path]["S22"]["results_filepath"]
-        s22_switchpath = self.lynx_config.paths[path]["S22"]["switchpath"]
-        self.switch_bank.set_all_switches(s22_switchpath)
-        gain = self.na_test.get_ratioed_power_measurement(bandpath=bandpath, gain_setting=attenuation_setting, ratioed_power="S22", format="MLOG", statefilepath=s22_state_filepath)
-        self.process_and_write_module_S_param(filepath=s22_results_filepath, bucket=gain, headers=True)
-        self._emit_periodic_snapshot(phase="na-s22")
-
-        self.clean_up()
+                self._emit_periodic_snapshot(phase="sig_a-running")
 
-    def _run_sig_a_performance_tests(self, path):
-        # initial snapshot to GUI
-        self._emit_periodic_snapshot(phase="tests-start")
-
-        logger.info("SIG_A tests: starting")
-        switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
-        freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
-        attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
-        bandwidths = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["bandwidths"]
-        waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
-        harmonic_start_stop = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["harmonic_start_stop"]
-        wideband_start_stop = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["wideband_start_stop"]
-        harmonic_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["harmonic_results_filepath"]
-        standard_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["standard_results_filepath"]
-        power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
-        wideband_results_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["wideband_results_filepath"]
-
-        self.switch_bank.set_all_switches(switchpath)
-
-        for frequency in freqs:
-            self._emit_periodic_snapshot(phase="sig_a-setup")
-            output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
-            input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
-            bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
-            rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
+                for attenuation_setting in attenuation_settings:
+                    for bandwidth in bandwidths:
+                        waveform = "OQPSK"
+                        standard_bucket = self.sig_a_test.get_standard_bandwidth_by_frequency(
+                            bandpath=bandpath,
+                            frequency=frequency,
+                            bandwidth=bandwidth,
+                            gain_setting=attenuation_setting,
+                            waveform=waveform
+                        )
 
-            self.rfsg.set_frequency(frequency=frequency)
-            self.rfsg.set_amplitude(rfsg_input_power)
-            self._emit_periodic_snapshot(phase="sig_a-running")
+                        self.process_and_write_module_standard_bandwidth_tests(standard_bucket, standard_results_filepath)
+                        self._emit_periodic_snapshot(phase="sig_a-standard")
 
-            for attenuation_setting in attenuation_settings:
-                for bandwidth in bandwidths:
-                    waveform = "OQPSK"
-                    standard_bucket = self.sig_a_test.get_standard_bandwidth_by_frequency(
-                        bandpath=bandpath,
-                        frequency=frequency,
-                        bandwidth=bandwidth,
-                        gain_setting=attenuation_setting,
-                        waveform=waveform
-                    )
-
-                    self.process_and_write_module_standard_bandwidth_tests(standard_bucket, standard_results_filepath)
-                    self._emit_periodic_snapshot(phase="sig_a-standard")
-
-                for waveform in waveforms:
-
-                    if frequency in [1.95E+9, 3E+9, 4E+9, 10E+9, 12.5E+9, 15E+9]:
-                        harmonic_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                    for waveform in waveforms:
+
+                        if frequency in _HARMONIC_FREQUENCIES:
+                            harmonic_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                                bandpath=bandpath,
+                                frequency=frequency,
+                                harmonic_start_stop=harmonic_start_stop,
+                                waveform=waveform,
+                                gain_setting=attenuation_setting,
+                            )
+                            self.process_and_write_module_harmonic_tests(harmonic_bucket, harmonic_results_filepath)
+                            self._emit_periodic_snapshot(phase="sig_a-harmonic")
+
+                        wideband_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                            bandpath=bandpath,
+                            frequency=frequency,
+                            harmonic_start_stop=wideband_start_stop,
+                            waveform=waveform,
+                            gain_setting=attenuation_setting
+                        )
+                        self.process_and_write_module_harmonic_tests(wideband_bucket, wideband_results_filepath)
+                        self._emit_periodic_snapshot(phase="sig_a-wideband")
+
+                        power_meter_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
                             bandpath=bandpath,
                             frequency=frequency,
-                            harmonic_start_stop=harmonic_start_stop,
                             waveform=waveform,
                             gain_setting=attenuation_setting,
+                            output_loss=output_loss,
                         )
-                        self.process_and_write_module_harmonic_tests(harmonic_bucket, harmonic_results_filepath)
-                        self._emit_periodic_snapshot(phase="sig_a-harmonic")
-
-                    wideband_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
-                        bandpath=bandpath,
-                        frequency=frequency,
-                        harmonic_start_stop=wideband_start_stop,
-                        waveform=waveform,
-                        gain_setting=attenuation_setting
-                    )
-                    self.process_and_write_module_harmonic_tests(wideband_bucket, wideband_results_filepath)
-                    self._emit_periodic_snapshot(phase="sig_a-wideband")
-
-                    power_meter_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
-                        bandpath=bandpath,
-                        frequency=frequency,
-                        waveform=waveform,
-                        gain_setting=attenuation_setting,
-                        output_loss=output_loss,
-                    )
-                    self.process_and_write_module_power_meter_tests(power_meter_bucket, power_meter_filepath)
-                    self._emit_periodic_snapshot(phase="sig_a-power-meter")
-
-            self.rfsg.stop()
-            noise_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
-                bandpath=bandpath,
-                frequency=frequency,
-                harmonic_start_stop=wideband_start_stop,
-                waveform="CW",
-                gain_setting=attenuation_setting,
-            )
-            self.process_and_write_module_harmonic_tests(noise_bucket, wideband_results_filepath)
-            self._emit_periodic_snapshot(phase="sig_a-noise")
+                        self.process_and_write_module_power_meter_tests(power_meter_bucket, power_meter_filepath)
+                        self._emit_periodic_snapshot(phase="sig_a-power-meter")
 
-        self.clean_up()
+                self.rfsg.stop()
+                noise_bucket = self.sig_a_test.get_harmonics_by_frequency_and_switchpath(
+                    bandpath=bandpath,
+                    frequency=frequency,
+                    harmonic_start_stop=wideband_start_stop,
+                    waveform="CW",
+                    gain_setting=attenuation_setting,
+                )
+                self.process_and_write_module_harmonic_tests(noise_bucket, wideband_results_filepath)
+                self._emit_periodic_snapshot(phase="sig_a-noise")
+
+            self.clean_up()
+        except BaseException:
+            self._close_results_after_error()
+            raise
 
     def _run_pin_pout_functional_tests(self, path):
-        # initial snapshot to GUI
-        self._emit_periodic_snapshot(phase="tests-start")
-
-        logger.info("SIG_A tests: starting")
-        switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
-        freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
-        attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
-        waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
-        power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
-
-        self.switch_bank.set_all_switches(switchpath)
-        for frequency in freqs:
-            self._emit_periodic_snapshot(phase="sig_a-setup")
-            output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
-            input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
+        try:
+            # initial snapshot to GUI
+            self._emit_periodic_snapshot(phase="tests-start")
+
+            logger.info("SIG_A tests: starting")
+            switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
+            freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
+            attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
+            waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
+            power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
+
+            self.switch_bank.set_all_switches(switchpath)
             bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
-            rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
+            for frequency in freqs:
+                self._emit_periodic_snapshot(phase="sig_a-setup")
+                output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
+                input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
+                rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
 
-            self.rfsg.set_frequency(frequency=frequency)
-            self.rfsg.set_amplitude(rfsg_input_power)
-            self._emit_periodic_snapshot(phase="sig_a-running")
+                self._emit_periodic_snapshot(phase="sig_a-running")
 
-            for attenuation_setting in attenuation_settings:
-                for waveform in waveforms:
-                    golden_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
-                        bandpath=bandpath,
-                        frequency=frequency,
-                        waveform=waveform,
-                        gain_setting=attenuation_setting,
-                        output_loss=output_loss
-                    )
-                    self.process_and_write_module_power_meter_tests(golden_bucket, power_meter_filepath)
-                    self._emit_periodic_snapshot(phase="sig_a-power-meter")
+                for attenuation_setting in attenuation_settings:
+                    for waveform in waveforms:
+                        golden_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
+                            bandpath=bandpath,
+                            frequency=frequency,
+                            waveform=waveform,
+                            gain_setting=attenuation_setting,
+                            output_loss=output_loss
+                        )
+                        self.process_and_write_module_power_meter_tests(golden_bucket, power_meter_filepath)
+                        self._emit_periodic_snapshot(phase="sig_a-power-meter")
         
-        self.clean_up()
+            self.clean_up()
+        except BaseException:
+            self._close_results_after_error()
+            raise
 
     def _run_pin_pout_functional_rolling(self, path, time_per_path):
-        # initial snapshot to GUI
-        self._emit_periodic_snapshot(phase="functional-rolling-start")
-
-        logger.info("SIG_A tests: starting")
-        switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
-        freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
-        attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
-        waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
-        power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
-
-        self.switch_bank.set_all_switches(switchpath)
-        frequency = freqs[1]
-        attenuation_setting = 0
-        waveform = waveforms[0]
-
-        self._emit_periodic_snapshot(phase="sig_a-setup")
-        output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
-        input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
-        bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
-        rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
-
-        self.rfsg.set_frequency(frequency=frequency)
-        self.rfsg.set_amplitude(rfsg_input_power)
-        self._emit_periodic_snapshot(phase="pin_pout_functional_rolling_setup")
-
-        t_start = time.time()
-        while time.time() - t_start < time_per_path:
-            golden_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
-                bandpath=bandpath,
-                frequency=frequency,
-                waveform=waveform,
-                gain_setting=attenuation_setting,
-                output_loss=output_loss
-            )
-            self.process_and_write_module_power_meter_tests(golden_bucket, power_meter_filepath)
-            self._emit_periodic_snapshot(phase="pin_pout_functional_rolling")
+        try:
+            # initial snapshot to GUI
+            self._emit_periodic_snapshot(phase="functional-rolling-start")
+
+            logger.info("SIG_A tests: starting")
+            switchpath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["switchpath"]
+            freqs = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["freqs"]
+            attenuation_settings = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["attenuation_settings"]
+            waveforms = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["waveforms"]
+            power_meter_filepath = self.lynx_config.paths[path]["Signal Analyzer Bandwidth"]["power_meter_filepath"]
+
+            self.switch_bank.set_all_switches(switchpath)
+            frequency = freqs[1]
+            attenuation_setting = 0
+            waveform = waveforms[0]
+
+            self._emit_periodic_snapshot(phase="sig_a-setup")
+            output_loss = self.sig_a_test.config.get_output_loss_by_path_and_freq(path, freq=frequency)
+            input_loss = self.sig_a_test.config.get_input_loss_by_path_and_freq(path, freq=frequency)
+            bandpath = self.sig_a_test.config.get_bandpath_by_path(path)
+            rfsg_input_power = self.sig_a_test.input_power_validation(frequency, target_power=-10, start_power=-20, input_loss=input_loss)
 
-        self.clean_up()
+            self._emit_periodic_snapshot(phase="pin_pout_functional_rolling_setup")
+
+            t_start = time.time()
+            while time.time() - t_start < time_per_path:
+                golden_bucket = self.sig_a_test.get_power_meter_by_frequency_and_switchpath(
+                    bandpath=bandpath,
+                    frequency=frequency,
+                    waveform=waveform,
+                    gain_setting=attenuation_setting,
+                    output_loss=output_loss
+                )
+                self.process_and_write_module_power_meter_tests(golden_bucket, power_meter_filepath)
+                self._emit_periodic_snapshot(phase="pin_pout_functional_rolling")
+
+            self.clean_up()
+        except BaseException:
+            self._close_results_after_error()
+            raise
 
 if __name__ == "__main__":
     manager = PaTopLevelTestManager(sim=False)
@@ -2,6 +2,8 @@ import time
 import re
 from typing import Optional, Callable, Dict, Any
 import os
+import queue
+import threading
 import datetime as dt
 
 class SerialException(Exception):
@@ -16,7 +18,56 @@ except ImportError:
 from src.core.temp import TempProfileManager
 from src.utils.logging_utils import log_message
 
+_now = dt.datetime.now  # bound once; called for every telemetry row
+
+# Minimal stubs to allow simulation without importing heavy instrument stack
+class _SimPowerSupply:
+    __slots__ = ("_v", "_c", "_out")
+
+    def __init__(self):
+        self._v = None
+        self._c = None
+        self._out = False
+    def set_voltage(self, v: float):
+        self._v = float(v)
+    def set_current(self, c: float):
+        self._c = float(c)
+    def set_output_state(self, on: bool):
+        self._out = bool(on)
+    def get_voltage(self):
+        return self._v
+    def get_current(self):
+        return self._c
+    def get_output_state(self):
+        return self._out
+
+class _SimTestManager:
+    __slots__ = ("instruments_connection", "paths", "temp_probe", "temp_probe2", "power_supply",
+                 "temp_controller", "temp_channel")
+
+    def __init__(self):
+        self.instruments_connection = {"rfsa": False, "na": False, "daq": False}
+        self.paths = ["SIM_PATH"]
+        self.temp_probe = None
+        self.temp_probe2 = None
+        self.power_supply = _SimPowerSupply()
+        self.temp_controller = None
+        self.temp_channel = 1
+    def set_temp_controller(self, temp_controller, channel=1):
+        self.temp_controller = temp_controller
+        self.temp_channel = channel
+    def run_and_process_tests(self, *args, **kwargs):
+        _ = (args, kwargs)
+        return None
+
 class LynxThermalCycleManager:
+    # Max telemetry rows written per batch by the background CSV writer
+    TELEMETRY_FLUSH_ROWS = 64
+    # Write buffer for the open telemetry CSV
+    TELEMETRY_BUFFER_BYTES = 65536
+    # Minimum seconds between throttled telemetry rows
+    TELEMETRY_INTERVAL_S = 2.5
+
     def __init__(self, simulation_mode=False, dwell_scale: float = 1.0):
         """
         Initialize the Lynx Thermal Cycle Manager.
@@ -30,36 +81,6 @@ class LynxThermalCycleManager:
             self.dwell_scale = float(dwell_scale)
         except (TypeError, ValueError):
             self.dwell_scale = 1.0
-        # Minimal stub to allow simulation without importing heavy instrument stack
-        class _SimPowerSupply:
-            def __init__(self):
-                self._v = None
-                self._c = None
-                self._out = False
-            def set_voltage(self, v: float):
-                self._v = float(v)
-            def set_current(self, c: float):
-                self._c = float(c)
-            def set_output_state(self, on: bool):
-                self._out = bool(on)
-            def get_voltage(self):
-                return self._v
-            def get_current(self):
-                return self._c
-            def get_output_state(self):
-                return self._out
-
-        class _SimTestManager:
-            def __init__(self):
-                self.instruments_connection = {"rfsa": False, "na": False, "daq": False}
-                self.paths = ["SIM_PATH"]
-                self.temp_probe = None
-                self.temp_probe2 = None
-                self.power_supply = _SimPowerSupply()
-            def run_and_process_tests(self, *args, **kwargs):
-                _ = (args, kwargs)
-                return None
-
         if simulation_mode:
             self.test_manager = _SimTestManager()
         else:
@@ -118,6 +139,16 @@ class LynxThermalCycleManager:
         self._telemetry_last_ts = 0.0
         self.current_step = None
 
+        # CSV rows are handed to a background writer so the control loop never blocks on disk I/O
+        self._telemetry_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._telemetry_writer = None
+        # A stopped writer that was still draining when close_telemetry gave up waiting
+        self._telemetry_draining = None
+        self._start_telemetry_writer()
+
+        # Held for the duration of a run; a second caller is refused instead of sharing the instruments
+        self._run_lock = threading.Lock()
+
     # --------- Internal helpers ---------
     def _apply_power_for_step(self, voltage: float, current: float):
         try:
@@ -539,30 +570,9 @@ class LynxThermalCycleManager:
         self._user_telemetry_callback = callback
         self.telemetry_callback = callback
 
-        # Define a wrapper: write to CSV, then invoke user callback.
-        def _csv_proxy(payload: Dict[str, Any]):
-            try:
-                self._log_external_telemetry(payload)
-            except Exception:
-                # Never let CSV issues kill the callback chain
-                pass
-            # Finally, pass through to the user callback if present
-            try:
-                if self._user_telemetry_callback is not None:
-                    self._user_telemetry_callback(payload)
-            except Exception:
-                pass
-
-        # Also forward to the underlying test manager
-        try:
-            tm_cb_setter = getattr(self.test_manager, "set_telemetry_callback", None)
-            tm_sink_setter = getattr(self.test_manager, "set_external_telemetry_sink", None)
-            if callable(tm_cb_setter):
-                tm_cb_setter(_csv_proxy)
-            if callable(tm_sink_setter):
-                tm_sink_setter(_csv_proxy)
-        except Exception:
-            pass
+        # The composite callback attached to the test manager reads the user callback at call time,
+        # so it only needs (re)attaching, not rebuilding per callback.
+        self._attach_test_manager_csv_callback()
 
     def _attach_test_manager_csv_callback(self) -> None:
         """Ensure the test manager has a callback that logs to CSV and optionally to the user GUI."""
@@ -582,10 +592,11 @@ class LynxThermalCycleManager:
                 except Exception:
                     pass
             tm_cb_setter(_composite)
-            # Also wire as an external sink if supported, providing redundancy
+            # Wire a single path only: the test manager emits to both the sink and the callback,
+            # so registering the composite on both wrote every CSV row and GUI update twice.
             if callable(tm_sink_setter):
                 try:
-                    tm_sink_setter(_composite)
+                    tm_sink_setter(None)
                 except Exception:
                     pass
         except Exception:
@@ -667,9 +678,9 @@ class LynxThermalCycleManager:
             # Timestamp: use payload timestamp or now
             ts = payload.get("timestamp")
             try:
-                ts_str = (ts.isoformat() if hasattr(ts, "isoformat") else str(ts)) if ts else dt.datetime.now().isoformat()
+                ts_str = (ts.isoformat() if hasattr(ts, "isoformat") else str(ts)) if ts else _now().isoformat()
             except Exception:
-                ts_str = dt.datetime.now().isoformat()
+                ts_str = _now().isoformat()
 
             line = [
                 ts_str,
@@ -695,11 +706,73 @@ class LynxThermalCycleManager:
                 str(date_string) if date_string is not None else "",
                 str(float(temp_value)) if isinstance(temp_value, (int, float)) else "",
             ]
-            with open(self.telemetry_path, "a", encoding="utf-8") as f:
-                f.write(",".join(map(str, line)) + "\n")
+            self._write_telemetry_row(line)
         except Exception as e:
             print(e)
 
+    def _write_telemetry_row(self, line: list) -> None:
+        """Queue one CSV row for the background telemetry writer."""
+        self._telemetry_queue.put(",".join(map(str, line)) + "\n")
+
+    def _start_telemetry_writer(self) -> None:
+        if self.telemetry_path is None or self._telemetry_writer is not None:
+            return
+        draining = self._telemetry_draining
+        if draining is not None:
+            # Two writers on one queue would interleave rows in the CSV; let the old one finish first
+            draining.join()
+            self._telemetry_draining = None
+        self._telemetry_writer = threading.Thread(
+            target=self._telemetry_writer_loop, name="telemetry-writer", daemon=True
+        )
+        self._telemetry_writer.start()
+
+    def _telemetry_writer_loop(self) -> None:
+        """Append queued telemetry rows to the CSV until a None sentinel is received.
+
+        Rows that are already waiting are drained and written together (up to
+        TELEMETRY_FLUSH_ROWS per batch) so bursts cost one write instead of one per row.
+        """
+        try:
+            f = open(self.telemetry_path, "a", encoding="utf-8", buffering=self.TELEMETRY_BUFFER_BYTES)
+        except OSError as e:
+            print(e)
+            return
+        # The file stays open for the whole run; each batch is flushed so the CSV
+        # is current on disk without paying an open/close per write.
+        with f:
+            done = False
+            while not done:
+                batch = [self._telemetry_queue.get()]
+                while len(batch) < self.TELEMETRY_FLUSH_ROWS:
+                    try:
+                        batch.append(self._telemetry_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    # Rows queued behind the sentinel (the next run's) are still written, not dropped
+                    batch = [row for row in batch if row is not None]
+                    done = True
+                if not batch:
+                    continue
+                try:
+                    f.writelines(batch)
+                    f.flush()
+                except OSError as e:
+                    print(e)
+
+    def close_telemetry(self, timeout: float = 5.0) -> None:
+        """Flush pending telemetry rows and stop the background writer."""
+        writer = self._telemetry_writer
+        if writer is None:
+            return
+        self._telemetry_queue.put(None)
+        writer.join(timeout=timeout)
+        if writer.is_alive():
+            log_message(f"Telemetry writer still flushing after {timeout}s; the next run waits for it")
+            self._telemetry_draining = writer
+        self._telemetry_writer = None
+
     def _get_psu_snapshot(self):
         v = c = out = None
         psu = getattr(self.test_manager, "power_supply", None)
@@ -786,8 +859,10 @@ class LynxThermalCycleManager:
 
             daq_snapshot = self._get_daq_snapshot()
 
+            # One clock read per row, shared by the CSV line and the live payload
+            now = _now()
             line = [
-                dt.datetime.now().isoformat(),
+                now.isoformat(),
                 idx if idx is not None else "",
                 name,
                 cycle,
@@ -811,14 +886,13 @@ class LynxThermalCycleManager:
                 str(daq_snapshot.get("date_string")) if isinstance(daq_snapshot, dict) and "date_string" in daq_snapshot else "",
                 str(float(daq_snapshot.get("temp_value"))) if isinstance(daq_snapshot, dict) and isinstance(daq_snapshot.get("temp_value"), (int, float)) else "",
             ]
-            with open(self.telemetry_path, "a", encoding="utf-8") as f:
-                f.write(",".join(map(str, line)) + "\n")
+            self._write_telemetry_row(line)
 
             # Also emit to live user callback if any (avoid the CSV proxy to prevent duplicate writes)
             if self._user_telemetry_callback is not None:
                 try:
                     payload = {
-                        "timestamp": dt.datetime.now(),
+                        "timestamp": now,
                         "step_index": idx,
                         "step_name": name,
                         "cycle_type": cycle,
@@ -848,13 +922,26 @@ class LynxThermalCycleManager:
                               sig_a_performance: Optional[bool] = None,
                               na_performance: Optional[bool] = None):
         now = time.time()
-        if now - self._telemetry_last_ts >= 2.5:
+        if now - self._telemetry_last_ts >= self.TELEMETRY_INTERVAL_S:
             self._log_telemetry(phase=phase, step=step, setpoint_c=setpoint_c,
                                 pin_pout_functional=pin_pout_functional,
                                 sig_a_performance=sig_a_performance,
                                 na_performance=na_performance)
             self._telemetry_last_ts = now
 
+    def _hold_until(self, end: float, phase: str, **telemetry_kwargs):
+        """Hold (dwell/soak) until `end`, logging throttled telemetry.
+
+        Sleeps until the next telemetry row is due instead of spinning on time.time().
+        """
+        while True:
+            now = time.time()
+            if now >= end:
+                break
+            self._maybe_log_telemetry(phase=phase, **telemetry_kwargs)
+            next_due = self._telemetry_last_ts + self.TELEMETRY_INTERVAL_S
+            time.sleep(max(0.05, min(end, next_due) - time.time()))
+
     # --------- Tests integration ---------
     def _map_step_tests(self, step) -> tuple[bool, bool, bool]:
         """Map profile flags to test families and golden mode.
@@ -883,8 +970,6 @@ class LynxThermalCycleManager:
 
     def _run_tests_for_step(self, step) -> None:
         sig_a_perf, na_perf, pin_func = self._map_step_tests(step)
-        # Re-attach composite callback before tests in case something overwrote it
-        self._attach_test_manager_csv_callback()
 
         # Paths list (may be None or empty)
         try:
@@ -926,11 +1011,23 @@ class LynxThermalCycleManager:
 
     def run_thermal_cycle(self, profile_path):
         """Execute the temperature steps defined in a profile JSON file."""
-        self.temp_profile_manager = TempProfileManager(profile_path)
-        all_steps = self.temp_profile_manager.get_all_steps()
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError("A thermal cycle is already running")
+        try:
+            self.temp_profile_manager = TempProfileManager(profile_path)
+            all_steps = self.temp_profile_manager.get_all_steps()
 
-        log_message(f"Loaded thermal profile '{profile_path}' with {len(all_steps)} steps")
+            log_message(f"Loaded thermal profile '{profile_path}' with {len(all_steps)} steps")
 
+            self._start_telemetry_writer()
+            try:
+                self._run_profile_steps(all_steps)
+            finally:
+                self.close_telemetry()
+        finally:
+            self._run_lock.release()
+
+    def _run_profile_steps(self, all_steps):
         for idx, step in enumerate(all_steps, start=1):
             # store index for telemetry
             setattr(step, "_index", idx)
@@ -994,17 +1091,15 @@ class LynxThermalCycleManager:
 
                 if dwell_s > 0:
                     log_message(f"Dwelling at target for {dwell_s}s")
-                    end = time.time() + dwell_s
-                    while time.time() < end:
-                        # sp = self._control_update_if_enabled(target_c, poll_s=float(max(2.5, poll_s)))
-                        self._maybe_log_telemetry(
-                            phase="dwell",
-                            step=step,
-                            setpoint_c=setpoint_c,
-                            pin_pout_functional=pin_func,
-                            sig_a_performance=sig_a_perf,
-                            na_performance=na_perf,
-                        )
+                    self._hold_until(
+                        time.time() + dwell_s,
+                        phase="dwell",
+                        step=step,
+                        setpoint_c=setpoint_c,
+                        pin_pout_functional=pin_func,
+                        sig_a_performance=sig_a_perf,
+                        na_performance=na_perf,
+                    )
             elif cycle_type == "INT_CYCLE":
                 cycle_count = int(getattr(step, "num_cycles", 1) or 1)
                 high_temp = float(getattr(step, "high_temp", 0.0) or 0.0)
@@ -1034,17 +1129,15 @@ class LynxThermalCycleManager:
 
 
                     log_message(f"Dwelling at target for {soak_s}s")
-                    end = time.time() + soak_s
-                    while time.time() < end:
-                        # sp = self._control_update_if_enabled(target_c, poll_s=float(max(2.5, poll_s)))
-                        self._maybe_log_telemetry(
-                            phase="soak",
-                            step=step,
-                            setpoint_c=setpoint_c,
-                            pin_pout_functional=pin_func,
-                            sig_a_performance=sig_a_perf,
-                            na_performance=na_perf,
-                        )
+                    self._hold_until(
+                        time.time() + soak_s,
+                        phase="soak",
+                        step=step,
+                        setpoint_c=setpoint_c,
+                        pin_pout_functional=pin_func,
+                        sig_a_performance=sig_a_perf,
+                        na_performance=na_perf,
+                    )
 
 
                     self._apply_power_for_step(0.0, 0.0)  # turn off PSU between high and low
@@ -1061,17 +1154,15 @@ class LynxThermalCycleManager:
                         self.test_manager._run_pin_pout_functional_rolling(path=path, time_per_path=time_per_band)
 
                     log_message(f"Dwelling at target for {soak_s}s")
-                    end = time.time() + soak_s
-                    while time.time() < end:
-                        # sp = self._control_update_if_enabled(target_c, poll_s=float(max(2.5, poll_s)))
-                        self._maybe_log_telemetry(
-                            phase="soak",
-                            step=step,
-                            setpoint_c=setpoint_c,
-                            pin_pout_functional=pin_func,
-                            sig_a_performance=sig_a_perf,
-                            na_performance=na_perf,
-                        )
+                    self._hold_until(
+                        time.time() + soak_s,
+                        phase="soak",
+                        step=step,
+                        setpoint_c=setpoint_c,
+                        pin_pout_functional=pin_func,
+                        sig_a_performance=sig_a_perf,
+                        na_performance=na_perf,
+                    )
 
             # Optional: turn off power after this step
             if getattr(step, "power_off_after", False):
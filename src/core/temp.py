@@ -154,20 +154,29 @@ class TempProfileManager:
     def __init__(self, temp_profile_filepath):
         """ Initializes the TempProfileManager with a JSON profile file. """
         self.temp_profile_filepath = temp_profile_filepath
+        # Parse straight from the file object; the profile is only ever decoded once
         with open(temp_profile_filepath, 'r') as file:
-            temp_profile = file.read()
+            try:
+                profile_data = json.load(file)
+            except json.JSONDecodeError as e:
+                log_message(f"Error parsing JSON profile: {e}")
+                profile_data = []
 
-            self.steps = self.parse_json_profile(temp_profile)
-            self.expanded_steps = self.expand_all_cycles()
+        self.steps = self.build_steps(profile_data)
+        self.expanded_steps = self.expand_all_cycles()
 
     def parse_json_profile(self, json_profile):
         """ Parses a JSON profile and returns a list of temperature steps. """
         try:
             profile_data = json.loads(json_profile)
-            return [create_temp_step(**step) for step in profile_data]
         except json.JSONDecodeError as e:
             log_message(f"Error parsing JSON profile: {e}")
             return []
+        return self.build_steps(profile_data)
+
+    def build_steps(self, profile_data):
+        """ Builds temperature steps from already-decoded profile data (list of dicts). """
+        return [create_temp_step(**step) for step in profile_data]
     
     def expand_all_cycles(self):
         """Expand all cycle steps into individual temperature steps."""
@@ -1,12 +1,13 @@
 import sys
 import os
-import threading
 import queue
+import threading
 import datetime as dt
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import Optional, Dict, Any, Deque, Callable
 
 from src.core.lynx_thermal_cycle import LynxThermalCycleManager
-from src.utils.logging_utils import log_queue
+from src.utils.logging_utils import log_queue, install_gui_handler
 
 
 def run_gui():  # pragma: no cover - convenience entrypoint
@@ -18,10 +19,14 @@ def run_gui():  # pragma: no cover - convenience entrypoint
         return
 
     class QTextEditLogger(QtWidgets.QTextEdit):
+        # Lines kept in the view; older lines are dropped so appends stay cheap on long runs
+        MAX_LINES = 5000
+
         def __init__(self, parent=None):
             super().__init__(parent)
             self.setReadOnly(True)
             self.setMinimumHeight(120)
+            self.document().setMaximumBlockCount(self.MAX_LINES)
 
         @QtCore.pyqtSlot(str)
         def append_line(self, line: str):
@@ -29,14 +34,37 @@ def run_gui():  # pragma: no cover - convenience entrypoint
             self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
 
     class LiveTelemetryModel(QtCore.QObject):
-        telemetry = QtCore.pyqtSignal(dict)
+        finished = QtCore.pyqtSignal(str)
 
     class LiveWindow(QtWidgets.QMainWindow):
-        def __init__(self, manager: LynxThermalCycleManager, parent=None):
+        # Samples kept per plotted series; older points roll off so redraw cost stays bounded
+        HISTORY_LEN = 7200
+        STATUS_TEMPLATE = "{phase} — {step}"
+        # Log pump interval: poll quickly while lines are arriving, then back off
+        # exponentially (doubling per empty tick) up to LOG_POLL_IDLE_MS when idle
+        LOG_POLL_BUSY_MS = 20
+        LOG_POLL_IDLE_MS = 1000
+        LOG_BATCH_MAX = 500
+        # Plot/status redraw interval; telemetry arriving in between is redrawn together
+        PLOT_REFRESH_MS = 250
+        # (legend name, pen options, payload aliases) per plotted series
+        SERIES = (
+            ('Actual Temp', dict(color='y', width=2), ('actual_temp_c', 'actual_c', 'controller_actual_c')),
+            ('Target', dict(color='c', style=QtCore.Qt.DashLine), ('target_c', 'target_temp_c', 'target')),
+            ('Setpoint', dict(color='m', style=QtCore.Qt.DotLine), ('setpoint_c', 'temp_setpoint_c', 'controller_setpoint_c')),
+            ('PSU V', dict(color='g', width=1), ('psu_voltage', 'psu_v', 'voltage')),
+            ('PSU A', dict(color='r', width=1), ('psu_current', 'psu_i', 'current')),
+            ('TC1 C', dict(color=(255, 165, 0), width=1), ('tc1_temp', 'tc1_c', 'tc_1_c')),
+            ('TC2 C', dict(color=(173, 216, 230), width=1), ('tc2_temp', 'tc2_c', 'tc_2_c')),
+        )
+
+        def __init__(self, manager_factory: Callable[[], LynxThermalCycleManager], parent=None):
             super().__init__(parent)
             self.setWindowTitle("Lynx Thermal Cycle - Live")
             self.resize(1000, 700)
-            self.manager = manager
+            # Built on the first run (off the Qt thread) so the window is not held up by instrument connects
+            self._manager_factory = manager_factory
+            self.manager: Optional[LynxThermalCycleManager] = None
 
             central = QtWidgets.QWidget(self)
             self.setCentralWidget(central)
@@ -49,14 +77,6 @@ def run_gui():  # pragma: no cover - convenience entrypoint
             self.plot.setLabel('left', 'Temperature (C) / PSU')
             layout.addWidget(self.plot)
 
-            self.curve_actual = self.plot.plot(pen=pg.mkPen('y', width=2), name='Actual Temp')
-            self.curve_target = self.plot.plot(pen=pg.mkPen('c', style=QtCore.Qt.DashLine), name='Target')
-            self.curve_setpoint = self.plot.plot(pen=pg.mkPen('m', style=QtCore.Qt.DotLine), name='Setpoint')
-            self.curve_v = self.plot.plot(pen=pg.mkPen('g', width=1), name='PSU V')
-            self.curve_c = self.plot.plot(pen=pg.mkPen('r', width=1), name='PSU A')
-            self.curve_tc1 = self.plot.plot(pen=pg.mkPen(color=(255, 165, 0), width=1), name='TC1 C')
-            self.curve_tc2 = self.plot.plot(pen=pg.mkPen(color=(173, 216, 230), width=1), name='TC2 C')
-
             # Log viewer
             self.log_view = QTextEditLogger(self)
             layout.addWidget(self.log_view)
@@ -68,44 +88,75 @@ def run_gui():  # pragma: no cover - convenience entrypoint
             self.btn_start.clicked.connect(self.choose_and_start)
             ctrl_layout.addWidget(self.btn_start)
             self.lbl_status = QtWidgets.QLabel("Idle")
+            self._last_status = "Idle"
             ctrl_layout.addWidget(self.lbl_status, 1)
 
-            # Data storage for plots
+            # Data storage for plots; each series gets its curve and a bounded history
             self.t0: Optional[float] = None
-            self.t: List[float] = []
-            self.actual: List[Optional[float]] = []
-            self.target: List[Optional[float]] = []
-            self.setpoint: List[Optional[float]] = []
-            self.v: List[Optional[float]] = []
-            self.c: List[Optional[float]] = []
-            self.tc1: List[Optional[float]] = []
-            self.tc2: List[Optional[float]] = []
-
-            # Telemetry signal model
+            self.t: Deque[float] = deque(maxlen=self.HISTORY_LEN)
+            self._series = tuple(
+                (self.plot.plot(pen=pg.mkPen(**pen), name=name), deque(maxlen=self.HISTORY_LEN), keys)
+                for name, pen, keys in self.SERIES
+            )
+
+            # Run-finished signal model
             self.model = LiveTelemetryModel()
-            self.model.telemetry.connect(self.on_telemetry)
+            self.model.finished.connect(self.on_run_finished)
+            # Telemetry from the run thread is parked here and drained by plot_timer on the Qt thread
+            self._telemetry_pending: Deque[Dict[str, Any]] = deque()
+            # One long-lived worker runs profiles in order; the Qt thread only hands it paths
+            self._run_q = queue.Queue()
+            self._run_busy = False
+            self._run_thread = threading.Thread(target=self._run_loop, name="live-run", daemon=True)
+            self._run_thread.start()
 
             # Start a timer to pump log messages from logging_utils.log_queue
             self.log_timer = QtCore.QTimer(self)
             self.log_timer.timeout.connect(self.drain_log_queue)
-            self.log_timer.start(200)
-
-            # Register callback to manager
-            self.manager.set_telemetry_callback(self._telemetry_callback)
-            # Note: test_manager telemetry is already forwarded by the thermal manager's callback.
-            # Setting both would double-emit into the GUI; keep only the manager callback.
+            self._log_poll_ms = self.LOG_POLL_BUSY_MS
+            self.log_timer.start(self._log_poll_ms)
+            self.plot_timer = QtCore.QTimer(self)
+            self.plot_timer.timeout.connect(self.drain_telemetry)
+            self.plot_timer.start(self.PLOT_REFRESH_MS)
 
         def choose_and_start(self):
             path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open Thermal Profile JSON", os.getcwd(), "JSON (*.json)")
             if not path:
                 return
+            if self._run_busy:
+                return
+            self._run_busy = True
+            self.btn_start.setEnabled(False)
             self.lbl_status.setText(f"Running: {os.path.basename(path)}")
-            thread = threading.Thread(target=self.manager.run_thermal_cycle, args=(path,), daemon=True)
-            thread.start()
+            self._run_q.put(path)
+
+        def _run_loop(self):
+            while True:
+                self._run_profile(self._run_q.get())
+
+        def _run_profile(self, path: str):
+            # Worker thread: never touch widgets here, report back through the model signal
+            status = f"Finished: {os.path.basename(path)}"
+            try:
+                if self.manager is None:
+                    self.manager = self._manager_factory()
+                    # Note: test_manager telemetry is already forwarded by the thermal manager's callback.
+                    # Setting both would double-emit into the GUI; keep only the manager callback.
+                    self.manager.set_telemetry_callback(self._telemetry_callback)
+                self.manager.run_thermal_cycle(path)
+            except Exception as e:
+                status = f"Failed: {e}"
+            self.model.finished.emit(status)
+
+        @QtCore.pyqtSlot(str)
+        def on_run_finished(self, status: str):
+            self.lbl_status.setText(status)
+            self._run_busy = False
+            self.btn_start.setEnabled(True)
 
         def _telemetry_callback(self, payload: Dict[str, Any]):
-            # shift to Qt thread via signal
-            self.model.telemetry.emit(payload)
+            # Run thread: only park the sample; the Qt thread picks it up in drain_telemetry
+            self._telemetry_pending.append(payload)
 
         def _coerce_timestamp(self, ts_val: Any) -> dt.datetime:
             """Best-effort conversion of various timestamp representations to datetime."""
@@ -136,8 +187,7 @@ def run_gui():  # pragma: no cover - convenience entrypoint
                     return payload[k]
             return None
 
-        @QtCore.pyqtSlot(dict)
-        def on_telemetry(self, payload: Dict[str, Any]):
+        def _ingest_telemetry(self, payload: Dict[str, Any]):
             # Consume payload as-is; do not query instruments from GUI thread.
 
             # Update time vector
@@ -145,51 +195,65 @@ def run_gui():  # pragma: no cover - convenience entrypoint
             ts = self._coerce_timestamp(ts_raw)
             if self.t0 is None:
                 self.t0 = ts.timestamp()
-            t = ts.timestamp() - self.t0
-            self.t.append(t)
-
-            # Extract values
-            def to_num(val):
-                return float(val) if isinstance(val, (int, float)) else None
+            self.t.append(ts.timestamp() - self.t0)
 
+            # Extract values; non-numeric samples are stored as 0 so the stored
+            # series can be handed to setData directly without re-cleaning history.
             # Accept a few common aliases for resilience across emitters
-            self.actual.append(to_num(self._first(payload, 'actual_temp_c', 'actual_c', 'controller_actual_c')))
-            self.target.append(to_num(self._first(payload, 'target_c', 'target_temp_c', 'target')))
-            self.setpoint.append(to_num(self._first(payload, 'setpoint_c', 'temp_setpoint_c', 'controller_setpoint_c')))
-            self.v.append(to_num(self._first(payload, 'psu_voltage', 'psu_v', 'voltage')))
-            self.c.append(to_num(self._first(payload, 'psu_current', 'psu_i', 'current')))
-            self.tc1.append(to_num(self._first(payload, 'tc1_temp', 'tc1_c', 'tc_1_c')))
-            self.tc2.append(to_num(self._first(payload, 'tc2_temp', 'tc2_c', 'tc_2_c')))
-
-            # Update curves with non-None filtering
-            def clean(data):
-                return [x if isinstance(x, (int, float)) else 0 for x in data]
-
-            self.curve_actual.setData(self.t, clean(self.actual))
-            self.curve_target.setData(self.t, clean(self.target))
-            self.curve_setpoint.setData(self.t, clean(self.setpoint))
-            self.curve_v.setData(self.t, clean(self.v))
-            self.curve_c.setData(self.t, clean(self.c))
-            self.curve_tc1.setData(self.t, clean(self.tc1))
-            self.curve_tc2.setData(self.t, clean(self.tc2))
+            for _, data, keys in self._series:
+                val = self._first(payload, *keys)
+                data.append(float(val) if isinstance(val, (int, float)) else 0.0)
+
+        def drain_telemetry(self):
+            # Samples queued by the run thread since the last tick are folded in
+            # together, then each curve and the status label are redrawn once.
+            payload = None
+            try:
+                while True:
+                    payload = self._telemetry_pending.popleft()
+                    self._ingest_telemetry(payload)
+            except IndexError:
+                pass
+            if payload is None:
+                return
+
+            t_view = list(self.t)
+            for curve, data, _ in self._series:
+                curve.setData(t_view, list(data))
 
             # Status text
             phase = self._first(payload, 'phase', 'test_phase') or ''
             step = self._first(payload, 'step_name', 'step') or ''
-            self.lbl_status.setText(f"{phase} — {step}")
+            status = self.STATUS_TEMPLATE.format(phase=phase, step=step)
+            if status != self._last_status:
+                self._last_status = status
+                self.lbl_status.setText(status)
 
         def drain_log_queue(self):
+            # Drain what is pending (up to LOG_BATCH_MAX) and append it in one go so a burst
+            # of log lines costs one widget update and one scroll instead of one per line.
+            # The cap keeps a runaway producer from stalling the Qt thread; the rest is
+            # picked up on the next (busy-interval) tick.
+            batch = []
             try:
-                while True:
-                    msg = log_queue.get_nowait()
-                    self.log_view.append_line(msg)
-            except queue.Empty:
+                for _ in range(self.LOG_BATCH_MAX):
+                    batch.append(str(log_queue.popleft()))
+            except IndexError:
                 pass
+            if batch:
+                self.log_view.append_line("\n".join(batch))
+            # Re-arm: a non-empty drain means more is likely coming, so check again soon
+            if batch:
+                self._log_poll_ms = self.LOG_POLL_BUSY_MS
+            else:
+                self._log_poll_ms = min(self._log_poll_ms * 2, self.LOG_POLL_IDLE_MS)
+            self.log_timer.start(self._log_poll_ms)
 
     app = QtWidgets.QApplication(sys.argv)
+    # Logger records reach the log view through log_queue, drained on the Qt thread
+    install_gui_handler()
     # Use simulation mode by default for development
-    manager = LynxThermalCycleManager(simulation_mode=False)
-    win = LiveWindow(manager)
+    win = LiveWindow(lambda: LynxThermalCycleManager(simulation_mode=False))
     win.show()
     sys.exit(app.exec_())
 
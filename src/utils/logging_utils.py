@@ -1,30 +1,119 @@
 import logging
+import logging.handlers
+import atexit
+import collections
 import datetime
 import queue
 import os
+import time
 
-# Create a global queue for log messages
-log_queue = queue.Queue()
+# Global buffer of log messages for the GUI to drain. Bounded so a run without
+# a GUI draining it does not grow without limit; the oldest lines drop first.
+log_queue = collections.deque(maxlen=65536)
 gui_handler = None  # Global reference to GUI handler
+_log_listener = None  # Runs the file/console/GUI handlers on its own thread
+_queue_handler = None  # Root handler feeding _log_listener
+_configured_for = None  # (serial_number, base_dir) of the running file/console handlers
+
+def _start_log_listener(handlers):
+    """(Re)start the pipeline: callers only enqueue on the root QueueHandler, handlers run on the listener thread."""
+    global _log_listener, _queue_handler
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    if _log_listener is not None:
+        _log_listener.stop()
+    records = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    _queue_handler = logging.handlers.QueueHandler(records)
+    root.addHandler(_queue_handler)
+
+def _stop_log_listener():
+    """Flush and stop the listener thread (also run at exit)."""
+    global _log_listener, _queue_handler, _configured_for
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            if handler is not gui_handler:
+                handler.close()
+        _log_listener = None
+    _configured_for = None
+
+atexit.register(_stop_log_listener)
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime once per second and reuses it for every record in that second."""
+    _cached_sec = None
+    _cached_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_str = time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (self._cached_str, record.msecs)
+
+class GUIHandler(logging.Handler):
+    """Hands formatted records to log_queue; runs on the listener thread and never touches a widget."""
+    def emit(self, record):
+        try:
+            log_queue.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+def install_gui_handler():
+    """Route all root log records (not only log_message calls) into log_queue for the GUI."""
+    global gui_handler
+    if gui_handler is None:
+        gui_handler = GUIHandler()
+        gui_handler.setFormatter(logging.Formatter("%(message)s"))
+    root = logging.getLogger()
+    if root.getEffectiveLevel() > logging.INFO:
+        root.setLevel(logging.INFO)
+    handlers = list(_log_listener.handlers) if _log_listener is not None else []
+    if gui_handler not in handlers:
+        _start_log_listener(handlers + [gui_handler])
+    return gui_handler
 
 def configure_logging(serial_number, base_dir: str | None = None):
+    global _configured_for
+    # Re-running for the same unit keeps the open log file instead of starting a new one
+    if _log_listener is not None and _configured_for == (serial_number, base_dir):
+        return
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     root = base_dir or os.getcwd()
     logs_dir = os.path.join(root, "logs")
     os.makedirs(logs_dir, exist_ok=True)
     log_filepath = os.path.join(logs_dir, f"test_log_{serial_number}_{timestamp}.log")
-    logging.basicConfig(filename=log_filepath, level=logging.INFO, format="%(asctime)s - %(message)s")
+    # Shared by both handlers; only the listener thread formats, so the cache needs no lock
+    formatter = _CachedTimeFormatter("%(asctime)s - %(message)s")
+    file_handler = logging.FileHandler(log_filepath)
+    file_handler.setFormatter(formatter)
     # Also log to console for CLI visibility
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
-    console.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
-    logging.getLogger().addHandler(console)
+    console.setFormatter(formatter)
 
+    # Callers only enqueue records; file, console and GUI formatting happen on the listener thread
+    _stop_log_listener()
+    handlers = [file_handler, console]
     if gui_handler is not None:
-        logging.getLogger().addHandler(gui_handler)  # Ensure GUI logging updates with new logs
+        handlers.append(gui_handler)  # Ensure GUI logging updates with new logs
+    _start_log_listener(handlers)
+    _configured_for = (serial_number, base_dir)
+    logging.getLogger().setLevel(logging.INFO)
 
 def log_message(message):
     """Log message globally and send to the queue for GUI updates."""
-    print(message)
+    if _configured_for is None:
+        print(message)  # once configure_logging has run, its console handler prints it
+    if gui_handler is None:
+        log_queue.append(message)  # Add message to the buffer for GUI processing
+    # With a GUI handler installed the line reaches log_queue via the listener, in order with logger output
     logging.info(message)
-    log_queue.put(message)  # Add message to the queue for GUI processing